@@ -1,19 +1,24 @@
 """CLI entry point for AI Roundtable."""
 
+import atexit
+import functools
+import os
 import signal
 import sys
-from datetime import datetime
+import threading
+import time
+from collections.abc import Sequence
 from pathlib import Path
-from typing import Optional
+from types import MappingProxyType
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional
 
 import click
 from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich.markdown import Markdown
-from rich.status import Status
 
 from .config import ConfigManager
+from .context import estimate_tokens
 from .logging_config import LoggingConfig, get_logger
 from .orchestrator import (
     MonoRepoOrchestrator,
@@ -22,11 +27,82 @@ from .orchestrator import (
 )
 from .session_manager import SessionManager, SessionManagerError
 
+if TYPE_CHECKING:
+    from rich.table import Table
+
 console = Console()
 logger = get_logger(__name__)
 
-# Global orchestrator reference for signal handlers
-_global_orchestrator: Optional[MonoRepoOrchestrator] = None
+# Set by the first shutdown signal; a second signal exits immediately
+_shutdown_in_progress = threading.Event()
+
+# Shared prompt_toolkit session for interactive input (created on first use)
+_prompt_session = None
+
+_INTERACTIVE_BANNER = (
+    "\n[bold cyan]═══════════════════════════════════════════════[/]\n"
+    "[bold cyan]         AI Roundtable Interactive Mode         [/]\n"
+    "[bold cyan]═══════════════════════════════════════════════[/]\n"
+)
+
+# Panel/spinner color per CLI (read-only)
+_CLI_COLORS = MappingProxyType({"claude_code": "cyan", "codex": "green", "gemini": "magenta"})
+
+# Spinner messages cycled while waiting on a CLI (read-only)
+_THINKING_MESSAGES = MappingProxyType({
+    "claude_code": ("Claude is thinking...", "Claude is exploring...", "Claude is analyzing..."),
+    "codex": ("Codex is thinking...", "Codex is reasoning...", "Codex is processing..."),
+    "gemini": ("Gemini is thinking...", "Gemini is contemplating...", "Gemini is working..."),
+})
+
+
+def _get_prompt_session():
+    """
+    Get the shared prompt_toolkit session.
+
+    Returns:
+        PromptSession, or None if prompt_toolkit is not installed or stdin is not a TTY
+    """
+    global _prompt_session
+    if _prompt_session is None and sys.stdin.isatty():
+        try:
+            from prompt_toolkit import PromptSession
+            from prompt_toolkit.history import FileHistory
+        except ImportError:
+            return None
+
+        history_file = Path.home() / ".ai-roundtable" / "input_history"
+        history_file.parent.mkdir(parents=True, exist_ok=True)
+        _prompt_session = PromptSession(
+            history=FileHistory(str(history_file)), enable_suspend=True
+        )
+    return _prompt_session
+
+
+def _prompt(markup: str) -> str:
+    """
+    Read a line of user input.
+
+    Uses the shared prompt_toolkit session when available, so every prompt
+    shares one history and Ctrl+C raises KeyboardInterrupt from the key
+    binding instead of going through the SIGINT handler. Falls back to
+    console.input otherwise.
+
+    Args:
+        markup: Rich markup for the prompt
+
+    Returns:
+        Line entered by the user
+    """
+    session = _get_prompt_session()
+    if session is None:
+        return console.input(markup)
+
+    from prompt_toolkit.formatted_text import ANSI
+
+    with console.capture() as capture:
+        console.print(markup, end="")
+    return session.prompt(ANSI(capture.get()))
 
 
 def _setup_signal_handlers(orchestrator: MonoRepoOrchestrator) -> None:
@@ -36,28 +112,50 @@ def _setup_signal_handlers(orchestrator: MonoRepoOrchestrator) -> None:
     Args:
         orchestrator: Orchestrator instance to clean up on shutdown
     """
-    global _global_orchestrator
-    _global_orchestrator = orchestrator
+    def stop_at_exit():
+        """Stop the orchestrator at interpreter exit (no-op if already stopped)."""
+        try:
+            orchestrator.stop_all_clis()
+        except Exception as e:
+            logger.error(f"Error during exit cleanup: {e}")
 
     def signal_handler(signum, frame):
         """Handle shutdown signals gracefully."""
+        if _shutdown_in_progress.is_set():
+            # Signal arrived while the first one is still shutting down;
+            # re-entering stop_all_clis would block on its lock
+            os._exit(128 + signum)
+        _shutdown_in_progress.set()
+
+        if orchestrator.stop_in_progress():
+            # The signal interrupted a stop already under way (e.g. the
+            # finally block in start); exiting from inside it would skip
+            # the rest of the cleanup, so let it finish instead
+            logger.debug("Shutdown already in progress; letting it finish")
+            console.print("\n[yellow]Exiting...[/]")
+            return
+
         sig_name = signal.Signals(signum).name
         logger.debug(f"Received {sig_name}")
         console.print(f"\n[yellow]Exiting...[/]")
 
         try:
-            if _global_orchestrator:
-                _global_orchestrator.stop_all_clis()
-                console.print("[green]✓ Session ended[/]")
+            orchestrator.stop_all_clis()
+            console.print("[green]✓ Session ended[/]")
         except Exception as e:
             logger.error(f"Error during shutdown: {e}")
             console.print(f"[red]✗ Error: {e}[/]")
         finally:
             sys.exit(0)
 
-    # Register handlers for SIGINT (Ctrl+C) and SIGTERM
+    # Covers SystemExit and any other exit path that skips the handlers below
+    atexit.register(stop_at_exit)
+
+    # Register handlers for SIGINT (Ctrl+C), SIGTERM and SIGHUP (terminal closed)
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
+    if hasattr(signal, "SIGHUP"):
+        signal.signal(signal.SIGHUP, signal_handler)
     logger.debug("Signal handlers registered")
 
 
@@ -87,21 +185,22 @@ def start(project: Path, verbose: bool):
         logger.debug("Verbose logging enabled")
 
     console.print("[bold green]🎭 AI Roundtable Interactive Mode[/]")
-    console.print(f"[dim]Project: {project.absolute()}[/]")
-    logger.debug(f"Starting interactive session for project: {project.absolute()}")
+    project_abs = project.absolute()
+    console.print(f"[dim]Project: {project_abs}[/]")
+    logger.debug(f"Starting interactive session for project: {project_abs}")
 
     orchestrator = None
 
     try:
         # Initialize configuration
         logger.debug("Loading configuration")
-        config = ConfigManager()
+        config = ConfigManager.from_cache()
         console.print("[dim]✓ Configuration loaded[/]")
 
         # Create orchestrator
         logger.debug("Initializing orchestrator")
         orchestrator = MonoRepoOrchestrator(
-            project_path=project.absolute(), config=config
+            project_path=project_abs, config=config
         )
         console.print("[dim]✓ Orchestrator initialized[/]")
 
@@ -149,8 +248,6 @@ def start(project: Path, verbose: bool):
     except KeyboardInterrupt:
         console.print("\n[yellow]⚠️  Interrupted by user[/]")
         logger.info("Interrupted by user")
-        if orchestrator:
-            orchestrator.stop_all_clis()
         sys.exit(0)
 
     except Exception as e:
@@ -158,9 +255,12 @@ def start(project: Path, verbose: bool):
         logger.error(f"Unexpected error in start command: {e}", exc_info=True)
         if verbose:
             console.print_exception()
+        raise click.Abort()
+
+    finally:
+        # No-op if the interactive loop or a signal handler already stopped it
         if orchestrator:
             orchestrator.stop_all_clis()
-        raise click.Abort()
 
 
 def _interactive_loop(orchestrator: MonoRepoOrchestrator):
@@ -170,9 +270,7 @@ def _interactive_loop(orchestrator: MonoRepoOrchestrator):
     Args:
         orchestrator: Running MonoRepoOrchestrator instance
     """
-    console.print("\n[bold cyan]═══════════════════════════════════════════════[/]")
-    console.print("[bold cyan]         AI Roundtable Interactive Mode         [/]")
-    console.print("[bold cyan]═══════════════════════════════════════════════[/]\n")
+    console.print(_INTERACTIVE_BANNER)
 
     # Display help
     _show_commands_help()
@@ -181,13 +279,16 @@ def _interactive_loop(orchestrator: MonoRepoOrchestrator):
     console.print(f"[dim]Active CLIs: {', '.join(orchestrator.get_active_clis())}[/]\n")
 
     # Conversation history for cross-CLI context sharing
-    # Each entry: {"role": "user"|"claude"|"codex"|"gemini", "content": "..."}
-    conversation_history = []
+    # Each entry: HistoryEntry(role="user"|"summary"|<cli name>, content)
+    context_settings = orchestrator.config.get_context_settings()
+    conversation_history = ConversationHistory(
+        token_limit=context_settings.get("compression_threshold", _DEFAULT_TOKEN_LIMIT)
+    )
 
     # Main loop
     while True:
         try:
-            user_input = console.input("[bold cyan]💬 >[/] ").strip()
+            user_input = _prompt("[bold cyan]💬 >[/] ").strip()
 
             if not user_input:
                 continue
@@ -215,12 +316,26 @@ def _interactive_loop(orchestrator: MonoRepoOrchestrator):
 def _show_commands_help():
     """Display available commands."""
     console.print("[bold]Available Commands:[/]\n")
+    console.print(_build_commands_help_table())
+
+
+@functools.lru_cache(maxsize=None)
+def _build_commands_help_table() -> "Table":
+    """
+    Build the interactive command reference table (once; the command set is fixed).
+
+    Returns:
+        Rich Table listing the interactive commands
+    """
+    from rich.table import Table
 
     table = Table(show_header=False, box=None, padding=(0, 2))
     table.add_column("Command", style="cyan")
     table.add_column("Description", style="dim")
 
+    table.add_row("@all <question>", "Ask all AIs in parallel")
     table.add_row("@seq <question>", "Ask AIs sequentially (chained context)")
+    table.add_row("@review <task>", "One AI proposes, another reviews")
     table.add_row("@claude <message>", "Direct message to Claude Code")
     table.add_row("@codex <message>", "Direct message to Codex")
     table.add_row("@gemini <message>", "Direct message to Gemini")
@@ -232,126 +347,378 @@ def _show_commands_help():
     table.add_row("help", "Show this help message")
     table.add_row("exit", "Exit interactive mode")
 
-    console.print(table)
+    return table
+
+
+class _ThinkingMessage:
+    """
+    Spinner text that cycles through a CLI's thinking messages.
+
+    The message is picked from the clock each time Rich refreshes the
+    Status, so no extra thread is needed to animate it.
+    """
+
+    def __init__(self, cli_name: str, period: float = 2.0):
+        self.color = _CLI_COLORS.get(cli_name, "white")
+        self.messages = _THINKING_MESSAGES.get(cli_name, ("Thinking...",))
+        self.period = period
+        self.started = time.monotonic()
+
+    def __rich__(self) -> str:
+        idx = int((time.monotonic() - self.started) / self.period) % len(self.messages)
+        return f"[{self.color}]{self.messages[idx]}[/]"
+
+
+def _cmd_exit(
+    orchestrator: MonoRepoOrchestrator, args: str, conversation_history: "ConversationHistory"
+):
+    """Leave interactive mode."""
+    raise EOFError()
+
+
+def _cmd_help(
+    orchestrator: MonoRepoOrchestrator, args: str, conversation_history: "ConversationHistory"
+):
+    """Show the interactive command reference."""
+    _show_commands_help()
+
+
+def _cmd_status(
+    orchestrator: MonoRepoOrchestrator, args: str, conversation_history: "ConversationHistory"
+):
+    """Show status of the running AI CLIs."""
+    _show_status(orchestrator)
+
+
+def _cmd_clear(
+    orchestrator: MonoRepoOrchestrator, args: str, conversation_history: "ConversationHistory"
+):
+    """Clear the cross-CLI conversation history."""
+    conversation_history.clear()
+    console.print("[green]✓ Conversation history cleared[/]")
+
+
+def _cmd_all(
+    orchestrator: MonoRepoOrchestrator, question: str, conversation_history: "ConversationHistory"
+):
+    """Ask all active CLIs in parallel, rendering each answer as it arrives."""
+    from rich.status import Status
+
+    if not question:
+        console.print("[red]Error: Please provide a question[/]")
+        return
+
+    # Claude Code may take part; don't run it alongside its own summary
+    _apply_background_summary(conversation_history, wait=True)
+
+    conversation_history.append(HistoryEntry("user", question))
+
+    active_clis = orchestrator.get_active_clis()
+    console.print(f"[dim]Asking {', '.join(active_clis)} in parallel...[/]\n")
+
+    with Status("[cyan]Waiting for responses...[/]", console=console, spinner="dots") as status:
+        pending = set(active_clis)
+        for response in orchestrator.parallel_discussion_iter(question, timeout=120):
+            pending.discard(response.cli_name)
+            if pending:
+                status.update(f"[cyan]Waiting for {', '.join(sorted(pending))}...[/]")
+            _display_responses([response])
+
+            if response.response and not response.error:
+                conversation_history.append(HistoryEntry(response.cli_name, response.response))
+
+
+def _cmd_seq(
+    orchestrator: MonoRepoOrchestrator, question: str, conversation_history: "ConversationHistory"
+):
+    """Run a sequential discussion across all active CLIs."""
+    from rich.status import Status
+
+    if not question:
+        console.print("[red]Error: Please provide a question[/]")
+        return
+
+    # Claude Code may take part; don't run it alongside its own summary
+    _apply_background_summary(conversation_history, wait=True)
+
+    # Add user question to history
+    conversation_history.append(HistoryEntry("user", question))
+
+    # Run sequential discussion with animated spinner
+    active_clis = orchestrator.get_active_clis()
+    console.print(f"[dim]Starting sequential discussion with {', '.join(active_clis)}...[/]\n")
+
+    # One response is yielded per CLI, in this order
+    cli_order = orchestrator.sequential_order()
+    if cli_order:
+        first = _ThinkingMessage(cli_order[0], period=1.5)
+    else:
+        first = "[cyan]Starting discussion...[/]"
+
+    with Status(first, console=console, spinner="dots") as status:
+        # Render each response before the next CLI is queried
+        for idx, response in enumerate(orchestrator.sequential_discussion_iter(question), start=1):
+            if idx < len(cli_order):
+                status.update(_ThinkingMessage(cli_order[idx], period=1.5))
+            _display_responses([response])
+
+            if response.response and not response.error:
+                conversation_history.append(HistoryEntry(response.cli_name, response.response))
+
+
+def _cmd_review(
+    orchestrator: MonoRepoOrchestrator, task: str, conversation_history: "ConversationHistory"
+):
+    """Run a proposer/reviewer iteration on a task."""
+    from rich.status import Status
+
+    if not task:
+        console.print("[red]Error: Please provide a task[/]")
+        return
+
+    # Claude Code may take part; don't run it alongside its own summary
+    _apply_background_summary(conversation_history, wait=True)
+
+    active_clis = orchestrator.get_active_clis()
+    if not active_clis:
+        console.print("[red]Error: No active CLIs[/]")
+        return
+
+    # Default to the first two active CLIs (a lone CLI reviews itself)
+    cli_choice = click.Choice(active_clis)
+    default_reviewer = active_clis[1] if len(active_clis) > 1 else active_clis[0]
+    try:
+        proposer = click.prompt("Proposer", type=cli_choice, default=active_clis[0])
+        reviewer = click.prompt("Reviewer", type=cli_choice, default=default_reviewer)
+        iterations = click.prompt("Iterations", type=click.IntRange(min=1), default=1)
+    except click.Abort:
+        # Ctrl+C / Ctrl+D at a prompt cancels the review, not the session
+        console.print("\n[yellow]Review cancelled[/]")
+        return
+
+    conversation_history.append(HistoryEntry("user", task))
+
+    with Status(
+        f"[cyan]{proposer} proposing, {reviewer} reviewing...[/]",
+        console=console,
+        spinner="dots",
+    ):
+        try:
+            results = orchestrator.review_mode(
+                task, proposer=proposer, reviewer=reviewer, iterations=iterations
+            )
+        except OrchestratorError as e:
+            console.print(f"[red]Error: {e}[/]")
+            return
+
+    # Show each proposal followed by its review
+    responses = []
+    for i, proposal in enumerate(results["proposals"]):
+        responses.append(proposal)
+        if i < len(results["reviews"]):
+            responses.append(results["reviews"][i])
+    _display_responses(responses)
+
+    for response in responses:
+        if response.response and not response.error:
+            conversation_history.append(HistoryEntry(response.cli_name, response.response))
+
+
+def _cmd_claude(
+    orchestrator: MonoRepoOrchestrator, message: str, conversation_history: "ConversationHistory"
+):
+    """Send a message directly to Claude Code."""
+    _send_direct_message(orchestrator, "claude_code", message, conversation_history)
+
+
+def _cmd_codex(
+    orchestrator: MonoRepoOrchestrator, message: str, conversation_history: "ConversationHistory"
+):
+    """Send a message directly to Codex."""
+    _send_direct_message(orchestrator, "codex", message, conversation_history)
 
 
-def _execute_command(orchestrator: MonoRepoOrchestrator, user_input: str, conversation_history: list):
+def _cmd_gemini(
+    orchestrator: MonoRepoOrchestrator, message: str, conversation_history: "ConversationHistory"
+):
+    """Send a message directly to Gemini."""
+    _send_direct_message(orchestrator, "gemini", message, conversation_history)
+
+
+# Commands matched against the whole (case-insensitive) input line
+_BAREWORDS = {
+    "exit": _cmd_exit,
+    "quit": _cmd_exit,
+    "q": _cmd_exit,
+    "help": _cmd_help,
+    "?": _cmd_help,
+    "status": _cmd_status,
+    "clear": _cmd_clear,
+}
+
+# Commands matched against the first token; the remainder is passed as argument
+_COMMANDS = {
+    "@all": _cmd_all,
+    "@seq": _cmd_seq,
+    "@review": _cmd_review,
+    "@claude": _cmd_claude,
+    "@codex": _cmd_codex,
+    "@gemini": _cmd_gemini,
+}
+
+
+def _execute_command(
+    orchestrator: MonoRepoOrchestrator,
+    user_input: str,
+    conversation_history: "ConversationHistory",
+):
     """
     Parse and execute user command.
 
     Args:
         orchestrator: MonoRepoOrchestrator instance
         user_input: User input string
-        conversation_history: List of conversation entries for cross-CLI context
-    """
-    # Exit command
-    if user_input.lower() in ["exit", "quit", "q"]:
-        raise EOFError()
-
-    # Help command
-    elif user_input.lower() in ["help", "?"]:
-        _show_commands_help()
-
-    # Status command
-    elif user_input.lower() == "status":
-        _show_status(orchestrator)
-
-    # Clear conversation history
-    elif user_input.lower() == "clear":
-        conversation_history.clear()
-        console.print("[green]✓ Conversation history cleared[/]")
-
-    # @seq - sequential discussion
-    elif user_input.startswith("@seq "):
-        question = user_input[5:].strip()
-        if not question:
-            console.print("[red]Error: Please provide a question[/]")
-            return
+        conversation_history: Conversation entries for cross-CLI context
+    """
+    handler = _BAREWORDS.get(user_input.lower())
+    if handler:
+        handler(orchestrator, "", conversation_history)
+        return
 
-        # Add user question to history
-        conversation_history.append({"role": "user", "content": question})
-
-        # Run sequential discussion with animated spinner
-        active_clis = orchestrator.get_active_clis()
-        console.print(f"[dim]Starting sequential discussion with {', '.join(active_clis)}...[/]\n")
-
-        with Status("[cyan]Starting discussion...[/]", console=console, spinner="dots") as status:
-            import threading
-            import time
-
-            # Track current CLI being processed
-            current_cli = {"name": "claude_code", "idx": 0}
-            stop_animation = threading.Event()
-
-            cli_colors = {"claude_code": "cyan", "codex": "green", "gemini": "magenta"}
-            cli_messages = {
-                "claude_code": ["Claude is thinking...", "Claude is exploring...", "Claude is analyzing..."],
-                "codex": ["Codex is thinking...", "Codex is reasoning...", "Codex is processing..."],
-                "gemini": ["Gemini is thinking...", "Gemini is contemplating...", "Gemini is working..."],
-            }
-
-            def animate_status():
-                msg_idx = 0
-                while not stop_animation.is_set():
-                    cli = current_cli["name"]
-                    color = cli_colors.get(cli, "white")
-                    messages = cli_messages.get(cli, ["Thinking..."])
-                    msg = messages[msg_idx % len(messages)]
-                    status.update(f"[{color}]{msg}[/]")
-                    msg_idx += 1
-                    time.sleep(1.5)
-
-            animation_thread = threading.Thread(target=animate_status, daemon=True)
-            animation_thread.start()
+    # Split on the first run of any whitespace, so "@seq\tquestion" works too
+    head, *rest = user_input.split(None, 1)
+    handler = _COMMANDS.get(head.lower())
+    if handler:
+        handler(orchestrator, rest[0].strip() if rest else "", conversation_history)
+        return
 
-            try:
-                responses = orchestrator.sequential_discussion(question)
-            finally:
-                stop_animation.set()
-                animation_thread.join(timeout=0.5)
+    console.print(
+        "[yellow]Unknown command. Type 'help' for available commands.[/]"
+    )
 
-        _display_responses(responses)
 
-        # Add all AI responses to history
-        for response in responses:
-            if response.response and not response.error:
-                conversation_history.append({
-                    "role": response.cli_name,
-                    "content": response.response
-                })
+# CLIs that keep their own session (Claude Code runs with --continue), so
+# their own replies are left out of the context sent back to them
+_SELF_CONTEXT_CLIS = ("claude_code",)
 
-    # Direct AI commands
-    elif user_input.startswith("@claude "):
-        _send_direct_message(orchestrator, "claude_code", user_input[8:].strip(), conversation_history)
 
-    elif user_input.startswith("@codex "):
-        _send_direct_message(orchestrator, "codex", user_input[7:].strip(), conversation_history)
+@dataclass(slots=True)
+class HistoryEntry:
+    """One turn of the interactive conversation history."""
 
-    elif user_input.startswith("@gemini "):
-        _send_direct_message(orchestrator, "gemini", user_input[8:].strip(), conversation_history)
+    role: str  # "user", "summary" or a CLI name
+    content: str
 
-    # Unknown command
-    else:
-        console.print(
-            "[yellow]Unknown command. Type 'help' for available commands.[/]"
-        )
 
+def _format_context_line(entry: HistoryEntry) -> str:
+    """Format a history entry as a line of cross-CLI context."""
+    role = entry.role
+    content = entry.content
+    if role == "user":
+        return f"[User]: {content}"
+    elif role == "summary":
+        return f"[Summary of earlier conversation]: {content}"
+    return f"[{role}]: {content}"
 
-def _estimate_tokens(text: str) -> int:
-    """Estimate token count (~4 characters per token)."""
-    return len(text) // 4
 
+# Default compression_threshold when the config does not set one
+_DEFAULT_TOKEN_LIMIT = 80000
 
-def _get_history_tokens(conversation_history: list) -> int:
-    """Calculate estimated tokens in conversation history."""
-    total_chars = sum(len(entry.get("content", "")) for entry in conversation_history)
-    return total_chars // 4
 
+class ConversationHistory(Sequence):
+    """
+    Conversation entries for cross-CLI context, with a running token total.
+
+    Each entry is a HistoryEntry. The entries can be read like a list, but
+    only append, extend, clear and compact change them; these keep
+    `tokens` and the formatted context lines up to date, so sending a
+    message does not rescan or reformat every entry.
+    `token_limit` is the compaction threshold, read from config once per
+    interactive session.
+    """
 
-def _summarize_history(orchestrator: MonoRepoOrchestrator, conversation_history: list) -> Optional[str]:
+    def __init__(self, entries=(), token_limit: int = _DEFAULT_TOKEN_LIMIT):
+        self._entries: list = []
+        self.tokens = 0
+        self.token_limit = token_limit
+        self._context_lines = []
+        self._context_lines_without = {cli: [] for cli in _SELF_CONTEXT_CLIS}
+
+        # Background summary in flight (see _start_background_summary)
+        self.pending_summary: Optional[Future] = None
+        self.pending_covers = 0
+        self.pending_generation = 0
+        self.generation = 0  # bumped by clear(), invalidates a pending summary
+
+        self.extend(entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __getitem__(self, index):
+        # Slices come back as plain lists, detached from the bookkeeping
+        return self._entries[index]
+
+    def append(self, entry: HistoryEntry) -> None:
+        self._entries.append(entry)
+        self.tokens += estimate_tokens(entry.content)
+
+        line = _format_context_line(entry)
+        self._context_lines.append(line)
+        for cli, lines in self._context_lines_without.items():
+            if entry.role != cli:
+                lines.append(line)
+
+    def extend(self, entries) -> None:
+        for entry in entries:
+            self.append(entry)
+
+    def clear(self) -> None:
+        self._reset()
+        self.generation += 1
+
+    def compact(self, summary: str, covered: int) -> None:
+        """
+        Replace the first entries with a summary, keeping the newer ones.
+
+        Args:
+            summary: Summary of the replaced entries
+            covered: Number of leading entries the summary replaces
+        """
+        newer = self[covered:]
+        self._reset()
+        self.append(HistoryEntry("summary", summary))
+        self.extend(newer)
+
+    def _reset(self) -> None:
+        """Drop all entries and derived state."""
+        self._entries.clear()
+        self.tokens = 0
+        self._context_lines.clear()
+        for lines in self._context_lines_without.values():
+            lines.clear()
+
+    def context_lines(self, cli_name: Optional[str] = None) -> list:
+        """
+        Get the formatted context lines to send to a CLI.
+
+        Args:
+            cli_name: Name of the CLI the context is for (None for all entries)
+
+        Returns:
+            List of context lines (do not modify)
+        """
+        return self._context_lines_without.get(cli_name, self._context_lines)
+
+
+def _summarize_history(orchestrator: MonoRepoOrchestrator, history_lines: list) -> Optional[str]:
     """
     Ask Claude to summarize the conversation history.
 
+    Args:
+        orchestrator: MonoRepoOrchestrator instance
+        history_lines: Formatted context lines of the history to summarize
+
     Returns:
         Summary string, or None if summarization failed
     """
@@ -359,23 +726,13 @@ def _summarize_history(orchestrator: MonoRepoOrchestrator, conversation_history:
     if not manager or not manager.is_alive():
         return None
 
-    # Build history text for summarization
-    history_text = []
-    for entry in conversation_history:
-        role = entry["role"]
-        content = entry["content"]
-        if role == "user":
-            history_text.append(f"[User]: {content}")
-        else:
-            history_text.append(f"[{role}]: {content}")
-
     summary_prompt = f"""Please provide a concise summary of this conversation, preserving:
 - Key decisions and conclusions
 - Important technical details
 - Action items or next steps
 
 Conversation:
-{chr(10).join(history_text)}
+{chr(10).join(history_lines)}
 
 Provide only the summary, no preamble."""
 
@@ -387,8 +744,131 @@ Provide only the summary, no preamble."""
         return None
 
 
+def _stream_response(manager, cli_name: str, message: str) -> str:
+    """
+    Send a message to a CLI, showing its output live as it streams in.
+
+    Shows the thinking spinner until the first output arrives, then the
+    tail of the response that fits on screen. The live view is transient;
+    the caller prints the complete response afterwards.
+
+    Args:
+        manager: AICliManager to send to
+        cli_name: Name of the CLI (for colors and title)
+        message: Full message to send
+
+    Returns:
+        Complete response text
+    """
+    from rich.live import Live
+    from rich.panel import Panel
+    from rich.spinner import Spinner
+    from rich.text import Text
+
+    color = _CLI_COLORS.get(cli_name, "white")
+    title = f"[bold {color}]{cli_name}[/]"
+    chunks = []
+    lines = [""]
+
+    spinner = Spinner("dots", text=_ThinkingMessage(cli_name))
+    with Live(spinner, console=console, refresh_per_second=8, transient=True) as live:
+        for chunk in manager.stream_command(message):
+            chunks.append(chunk)
+
+            # Keep a line view so only the visible tail is re-rendered
+            first, *rest = chunk.split("\n")
+            lines[-1] += first
+            lines.extend(rest)
+            visible = max(console.height - 4, 1)
+            live.update(Panel(Text("\n".join(lines[-visible:])), title=title, border_style=color))
+
+    return "".join(chunks).strip()
+
+
+# Share of the compression threshold at which history is summarized in the
+# background, ahead of the synchronous compaction at the threshold itself
+_BACKGROUND_SUMMARY_RATIO = 0.7
+
+
+def _start_background_summary(
+    orchestrator: MonoRepoOrchestrator, conversation_history: ConversationHistory
+) -> None:
+    """
+    Summarize the current history on a daemon thread.
+
+    The result is applied by _apply_background_summary; entries added in
+    the meantime are kept after the summary.
+
+    Args:
+        orchestrator: MonoRepoOrchestrator instance
+        conversation_history: History to summarize
+    """
+    # Copied, since the history keeps growing while the summary runs
+    snapshot = list(conversation_history.context_lines())
+    future = Future()
+
+    def run():
+        try:
+            future.set_result(_summarize_history(orchestrator, snapshot))
+        except BaseException as e:
+            future.set_exception(e)
+
+    conversation_history.pending_summary = future
+    conversation_history.pending_covers = len(snapshot)
+    conversation_history.pending_generation = conversation_history.generation
+    # Daemon thread, so exiting never waits on an in-flight summary
+    threading.Thread(target=run, daemon=True).start()
+    logger.debug(f"Started background summary of {len(snapshot)} entries")
+
+
+def _apply_background_summary(
+    conversation_history: ConversationHistory, wait: bool = False
+) -> bool:
+    """
+    Swap in a finished background summary, if there is one.
+
+    Args:
+        conversation_history: History with a possibly pending summary
+        wait: If True, block until a pending summary finishes
+
+    Returns:
+        True if the history was compacted
+    """
+    from rich.status import Status
+
+    future = conversation_history.pending_summary
+    if future is None:
+        return False
+
+    if not future.done():
+        if not wait:
+            return False
+        with Status(
+            "[dim]Waiting for background history summary...[/]", console=console, spinner="dots"
+        ):
+            future.exception()  # blocks until done
+
+    conversation_history.pending_summary = None
+    summary = None if future.exception() else future.result()
+    if not summary or conversation_history.pending_generation != conversation_history.generation:
+        # Failed, or the history was cleared while summarizing
+        return False
+
+    before_tokens = conversation_history.tokens
+    covered = conversation_history.pending_covers
+    conversation_history.compact(summary, covered)
+    console.print(
+        f"[green]✓ History compacted in background: {covered} entries summarized, "
+        f"{before_tokens:,} → {conversation_history.tokens:,} tokens[/]"
+    )
+    return True
+
+
 def _send_direct_message(
-    orchestrator: MonoRepoOrchestrator, cli_name: str, message: str, conversation_history: list
+    orchestrator: MonoRepoOrchestrator,
+    cli_name: str,
+    message: str,
+    conversation_history: "ConversationHistory",
 ):
     """
     Send direct message to a specific AI CLI with conversation context.
@@ -397,8 +877,10 @@ def _send_direct_message(
         orchestrator: MonoRepoOrchestrator instance
         cli_name: Name of CLI (claude_code, codex, gemini)
         message: Message to send
-        conversation_history: List of conversation entries for cross-CLI context
+        conversation_history: Conversation entries for cross-CLI context
     """
+    from rich.panel import Panel
+
     if not message:
         console.print("[red]Error: Please provide a message[/]")
         return
@@ -412,12 +894,19 @@ def _send_direct_message(
         console.print(f"[red]Error: {cli_name} is not running[/]")
         return
 
-    # Get token limit from config (default 80000)
-    context_settings = orchestrator.config.get_context_settings()
-    token_limit = context_settings.get("compression_threshold", 80000)
+    # Token limit from config, read once per session (default 80000)
+    token_limit = conversation_history.token_limit
+
+    # Pick up a summary finished in the background. Claude Code must not be
+    # sent to while it is still summarizing (both calls use --continue), and
+    # over the limit it is better to wait than to summarize a second time.
+    _apply_background_summary(
+        conversation_history,
+        wait=cli_name == "claude_code" or conversation_history.tokens > token_limit,
+    )
 
     # Check if history needs summarization
-    history_tokens = _get_history_tokens(conversation_history)
+    history_tokens = conversation_history.tokens
     history_entries = len(conversation_history)
 
     # Show current history stats
@@ -431,109 +920,70 @@ def _send_direct_message(
     console.print(f"[{token_color}]📊 History: {history_entries} entries, ~{history_tokens:,} tokens ({token_percentage:.1f}% of {token_limit:,} limit)[/]")
 
     if history_tokens > token_limit:
-        console.print(f"\n[yellow]{'='*50}[/]")
-        console.print(f"[yellow]⚠️  AUTO-COMPACTING TRIGGERED[/]")
-        console.print(f"[yellow]{'='*50}[/]")
-        console.print(f"[dim]History tokens ({history_tokens:,}) exceeded limit ({token_limit:,})[/]")
-        console.print(f"[dim]Asking Claude to summarize {history_entries} conversation entries...[/]\n")
-
-        summary = _summarize_history(orchestrator, conversation_history)
+        rule = f"[yellow]{'='*50}[/]"
+        console.print("\n".join([
+            f"\n{rule}",
+            "[yellow]⚠️  AUTO-COMPACTING TRIGGERED[/]",
+            rule,
+            f"[dim]History tokens ({history_tokens:,}) exceeded limit ({token_limit:,})[/]",
+            f"[dim]Asking Claude to summarize {history_entries} conversation entries...[/]\n",
+        ]))
+
+        summary = _summarize_history(orchestrator, conversation_history.context_lines())
         if summary:
-            summary_tokens = _estimate_tokens(summary)
+            summary_tokens = estimate_tokens(summary)
             # Replace history with summary
             conversation_history.clear()
-            conversation_history.append({"role": "summary", "content": summary})
-            console.print(f"[green]✓ History compacted successfully![/]")
-            console.print(f"[green]  Before: {history_tokens:,} tokens ({history_entries} entries)[/]")
-            console.print(f"[green]  After:  {summary_tokens:,} tokens (1 summary entry)[/]")
-            console.print(f"[green]  Saved:  {history_tokens - summary_tokens:,} tokens ({((history_tokens - summary_tokens) / history_tokens * 100):.1f}% reduction)[/]")
+            conversation_history.append(HistoryEntry("summary", summary))
+            saved_tokens = history_tokens - summary_tokens
+            console.print("\n".join([
+                "[green]✓ History compacted successfully![/]",
+                f"[green]  Before: {history_tokens:,} tokens ({history_entries} entries)[/]",
+                f"[green]  After:  {summary_tokens:,} tokens (1 summary entry)[/]",
+                f"[green]  Saved:  {saved_tokens:,} tokens "
+                f"({saved_tokens / history_tokens * 100:.1f}% reduction)[/]",
+                f"{rule}\n",
+            ]))
         else:
-            console.print("[yellow]⚠️  Summarization failed, falling back to truncation[/]")
             # Fallback: keep last 10 entries
             recent = conversation_history[-10:]
             old_tokens = history_tokens
             conversation_history.clear()
             conversation_history.extend(recent)
-            new_tokens = _get_history_tokens(conversation_history)
-            console.print(f"[yellow]  Kept last 10 entries: {old_tokens:,} → {new_tokens:,} tokens[/]")
-
-        console.print(f"[yellow]{'='*50}[/]\n")
+            new_tokens = conversation_history.tokens  # kept current by extend()
+            console.print("\n".join([
+                "[yellow]⚠️  Summarization failed, falling back to truncation[/]",
+                f"[yellow]  Kept last 10 entries: {old_tokens:,} → {new_tokens:,} tokens[/]",
+                f"{rule}\n",
+            ]))
 
     try:
         # Build context from conversation history
         # For Claude Code: exclude its own messages (it has --continue)
         # For Codex/Gemini: include full history
-        if cli_name == "claude_code":
-            filtered_history = [h for h in conversation_history if h["role"] not in ["claude_code"]]
-        else:
-            filtered_history = conversation_history
-
-        context_parts = []
-        if filtered_history:
-            context_parts.append("=== Previous conversation context ===")
-            for entry in filtered_history:
-                role = entry["role"]
-                content = entry["content"]
-                if role == "user":
-                    context_parts.append(f"[User]: {content}")
-                elif role == "summary":
-                    context_parts.append(f"[Summary of earlier conversation]: {content}")
-                else:
-                    context_parts.append(f"[{role}]: {content}")
-            context_parts.append("=== End of context ===\n")
-            context_parts.append(f"[User]: {message}")
-            full_message = "\n".join(context_parts)
+        context_lines = conversation_history.context_lines(cli_name)
+        if context_lines:
+            full_message = "\n".join([
+                "=== Previous conversation context ===",
+                *context_lines,
+                "=== End of context ===\n",
+                f"[User]: {message}",
+            ])
         else:
             full_message = message
 
         # Add user message to history
-        conversation_history.append({"role": "user", "content": message})
-
-        # Animated spinner while waiting for response
-        spinner_messages = {
-            "claude_code": ["[cyan]Claude is thinking...[/]", "[cyan]Claude is exploring...[/]", "[cyan]Claude is analyzing...[/]"],
-            "codex": ["[green]Codex is thinking...[/]", "[green]Codex is reasoning...[/]", "[green]Codex is processing...[/]"],
-            "gemini": ["[magenta]Gemini is thinking...[/]", "[magenta]Gemini is contemplating...[/]", "[magenta]Gemini is working...[/]"],
-        }
-        spinner_text = spinner_messages.get(cli_name, ["Thinking..."])[0]
-
-        with Status(spinner_text, console=console, spinner="dots") as status:
-            import random
-            import threading
-            import time
-
-            # Update spinner message periodically
-            stop_animation = threading.Event()
-
-            def animate_status():
-                messages = spinner_messages.get(cli_name, ["Thinking..."])
-                idx = 0
-                while not stop_animation.is_set():
-                    time.sleep(2)
-                    if not stop_animation.is_set():
-                        idx = (idx + 1) % len(messages)
-                        status.update(messages[idx])
-
-            animation_thread = threading.Thread(target=animate_status, daemon=True)
-            animation_thread.start()
+        conversation_history.append(HistoryEntry("user", message))
 
-            try:
-                response = manager.send_command(full_message)  # Uses configured timeout
-            finally:
-                stop_animation.set()
-                animation_thread.join(timeout=0.5)
+        # Spinner, then the response as it streams in (uses configured timeout)
+        response = _stream_response(manager, cli_name, full_message)
 
         # Add AI response to history
         if response:
-            conversation_history.append({"role": cli_name, "content": response})
+            conversation_history.append(HistoryEntry(cli_name, response))
 
         # Display response
-        color_map = {
-            "claude_code": "cyan",
-            "codex": "green",
-            "gemini": "magenta",
-        }
-        color = color_map.get(cli_name, "white")
+        color = _CLI_COLORS.get(cli_name, "white")
 
         console.print(
             Panel(
@@ -543,6 +993,17 @@ def _send_direct_message(
             )
         )
 
+        # Summarize ahead of the limit while the user reads the response
+        claude = orchestrator.ai_managers.get("claude_code")
+        if (
+            conversation_history.pending_summary is None
+            and token_limit > 0
+            and conversation_history.tokens > token_limit * _BACKGROUND_SUMMARY_RATIO
+            and claude
+            and claude.is_alive()
+        ):
+            _start_background_summary(orchestrator, conversation_history)
+
     except Exception as e:
         console.print(f"[red]Error communicating with {cli_name}: {e}[/]")
 
@@ -554,14 +1015,15 @@ def _display_responses(responses):
     Args:
         responses: List of DiscussionResponse objects
     """
+    from rich.console import Group
+    from rich.panel import Panel
+    from rich.text import Text
+
+    # Render all panels in one pass and one write
+    renderables = []
     for response in responses:
         # Determine color based on CLI
-        color_map = {
-            "claude_code": "cyan",
-            "codex": "green",
-            "gemini": "magenta",
-        }
-        color = color_map.get(response.cli_name, "white")
+        color = _CLI_COLORS.get(response.cli_name, "white")
 
         # Format title
         title = f"[bold {color}]{response.cli_name}[/]"
@@ -581,8 +1043,11 @@ def _display_responses(responses):
         else:
             content = "[dim]No response[/]"
 
-        console.print(Panel(content, title=title, border_style=color))
-        console.print()
+        renderables.append(Panel(content, title=title, border_style=color))
+        renderables.append(Text())
+
+    if renderables:
+        console.print(Group(*renderables))
 
 
 def _show_status(orchestrator: MonoRepoOrchestrator):
@@ -592,6 +1057,8 @@ def _show_status(orchestrator: MonoRepoOrchestrator):
     Args:
         orchestrator: MonoRepoOrchestrator instance
     """
+    from rich.table import Table
+
     summary = orchestrator.get_session_summary()
 
     console.print("\n[bold cyan]Session Status[/]\n")
@@ -622,7 +1089,8 @@ def _show_status(orchestrator: MonoRepoOrchestrator):
 def connect(project: Path, session_id: Optional[str]):
     """Connect to an existing AI Roundtable session."""
     console.print("[bold blue]🔗 Connecting to AI Roundtable session[/]")
-    console.print(f"[dim]Project: {project.absolute()}[/]")
+    project_abs = project.absolute()
+    console.print(f"[dim]Project: {project_abs}[/]")
 
     try:
         session_manager = SessionManager()
@@ -635,7 +1103,7 @@ def connect(project: Path, session_id: Optional[str]):
                 raise click.Abort()
         else:
             # Find session by project
-            session_info = session_manager.get_session_by_project(project.absolute())
+            session_info = session_manager.get_session_by_project(project_abs)
             if not session_info:
                 console.print(f"[yellow]No existing session found for this project[/]")
                 console.print("[dim]Use 'airt start' to create a new session[/]")
@@ -659,7 +1127,7 @@ def connect(project: Path, session_id: Optional[str]):
             raise click.Abort()
 
         # Load configuration
-        config = ConfigManager()
+        config = ConfigManager.from_cache()
 
         # Create orchestrator with existing session ID
         orchestrator = MonoRepoOrchestrator(
@@ -717,7 +1185,7 @@ def stop(project: Path, session_id: Optional[str], all_sessions: bool, force: bo
 
         if all_sessions:
             # Stop all active sessions
-            sessions_to_stop = session_manager.list_sessions(active_only=True)
+            sessions_to_stop = session_manager.list_sessions(active_only=True, load_history=False)
             if not sessions_to_stop:
                 console.print("[dim]No active sessions found[/]")
                 return
@@ -732,8 +1200,9 @@ def stop(project: Path, session_id: Optional[str], all_sessions: bool, force: bo
 
         else:
             # Stop session for current project
-            console.print(f"[dim]Project: {project.absolute()}[/]")
-            session_info = session_manager.get_session_by_project(project.absolute())
+            project_abs = project.absolute()
+            console.print(f"[dim]Project: {project_abs}[/]")
+            session_info = session_manager.get_session_by_project(project_abs)
             if not session_info:
                 console.print("[yellow]No session found for this project[/]")
                 return
@@ -744,7 +1213,9 @@ def stop(project: Path, session_id: Optional[str], all_sessions: bool, force: bo
             console.print(f"\n[cyan]Stopping session: {session_info.session_id}[/]")
 
             # Clean up session
-            success = session_manager.cleanup_session(session_info.session_id)
+            success = session_manager.cleanup_session(
+                session_info.session_id, session_info=session_info
+            )
 
             if success:
                 console.print(f"[green]✓ Session {session_info.session_id} stopped[/]")
@@ -758,63 +1229,102 @@ def stop(project: Path, session_id: Optional[str], all_sessions: bool, force: bo
         raise click.Abort()
 
 
+def _build_status_table(summaries: list) -> "Table":
+    """
+    Build the session status table.
+
+    Args:
+        summaries: Summary dicts from SessionManager.list_sessions_with_summaries
+
+    Returns:
+        Rich Table with one row per session
+    """
+    from rich.table import Table
+
+    table = Table(show_header=True, header_style="bold magenta")
+    table.add_column("Session ID", style="cyan", width=30)
+    table.add_column("Project", style="white", width=30)
+    table.add_column("State", width=10)
+    table.add_column("Active CLIs", width=20)
+    table.add_column("Last Active", style="dim", width=20)
+
+    for summary in summaries:
+        session_id = summary["session_id"]
+
+        # Format state
+        state = summary["state"]
+        if summary["is_active"]:
+            state_display = f"[green]● {state}[/]"
+        else:
+            state_display = f"[dim]○ {state}[/]"
+
+        # Format active CLIs
+        active_clis = (
+            ", ".join(summary["active_clis"]) if summary["active_clis"] else "[dim]none[/]"
+        )
+
+        # Format last active time; stored by isoformat(), so "YYYY-MM-DDTHH:MM" is a prefix
+        try:
+            last_active_str = summary["last_active"][:16].replace("T", " ")
+        except (TypeError, AttributeError):
+            last_active_str = str(summary["last_active"])[:16]
+
+        # Truncate project path
+        project = Path(summary["project_path"]).name
+
+        table.add_row(
+            session_id[:28] + "..." if len(session_id) > 28 else session_id,
+            project,
+            state_display,
+            active_clis,
+            last_active_str,
+        )
+
+    return table
+
+
 @main.command()
 @click.option("--all", "show_all", is_flag=True, help="Show all sessions (not just active)")
-def status(show_all: bool):
+@click.option("--watch", is_flag=True, help="Keep refreshing the table until Ctrl+C")
+@click.option(
+    "--interval",
+    type=float,
+    default=2.0,
+    show_default=True,
+    help="Refresh interval for --watch (seconds)",
+)
+def status(show_all: bool, watch: bool, interval: float):
     """Show all active AI Roundtable sessions."""
+    from rich.live import Live
+
     console.print("[bold cyan]📊 AI Roundtable Session Status[/]\n")
 
     try:
         session_manager = SessionManager()
-        sessions = session_manager.list_sessions(active_only=not show_all)
+        summaries = session_manager.list_sessions_with_summaries(active_only=not show_all)
+
+        if watch:
+            # Only redraw when a summary actually changed
+            with Live(_build_status_table(summaries), console=console, auto_refresh=False) as live:
+                try:
+                    while True:
+                        time.sleep(interval)
+                        latest = session_manager.list_sessions_with_summaries(
+                            active_only=not show_all
+                        )
+                        if latest != summaries:
+                            summaries = latest
+                            live.update(_build_status_table(summaries), refresh=True)
+                except KeyboardInterrupt:
+                    pass
+            return
 
-        if not sessions:
+        if not summaries:
             console.print("[dim]No sessions found[/]")
             return
 
-        # Create table
-        table = Table(show_header=True, header_style="bold magenta")
-        table.add_column("Session ID", style="cyan", width=30)
-        table.add_column("Project", style="white", width=30)
-        table.add_column("State", width=10)
-        table.add_column("Active CLIs", width=20)
-        table.add_column("Last Active", style="dim", width=20)
-
-        for session in sessions:
-            summary = session_manager.get_session_summary(session.session_id)
-            if not summary:
-                continue
-
-            # Format state
-            state = summary["state"]
-            if summary["is_active"]:
-                state_display = f"[green]● {state}[/]"
-            else:
-                state_display = f"[dim]○ {state}[/]"
-
-            # Format active CLIs
-            active_clis = ", ".join(summary["active_clis"]) if summary["active_clis"] else "[dim]none[/]"
-
-            # Format last active time
-            try:
-                last_active = datetime.fromisoformat(summary["last_active"])
-                last_active_str = last_active.strftime("%Y-%m-%d %H:%M")
-            except:
-                last_active_str = summary["last_active"][:16]
-
-            # Truncate project path
-            project = Path(summary["project_path"]).name
-
-            table.add_row(
-                session.session_id[:28] + "..." if len(session.session_id) > 28 else session.session_id,
-                project,
-                state_display,
-                active_clis,
-                last_active_str,
-            )
-
-        console.print(table)
-        console.print(f"\n[dim]Total: {len(sessions)} session(s)[/]")
+        console.print(_build_status_table(summaries))
+        console.print(f"\n[dim]Total: {len(summaries)} session(s)[/]")
 
         # Show cleanup suggestion
         if not show_all:
@@ -835,14 +1345,15 @@ def status(show_all: bool):
 )
 def ask(question: str, project: Path):
     """Quick question mode - ask AIs a question sequentially without entering interactive mode."""
+    project_abs = project.absolute()
     console.print("[bold magenta]💬 Asking question (sequential mode)[/]")
     console.print(f"[dim]Question: {question}[/]")
-    console.print(f"[dim]Project: {project.absolute()}[/]\n")
+    console.print(f"[dim]Project: {project_abs}[/]\n")
 
     try:
         # Initialize
-        config = ConfigManager()
-        orchestrator = MonoRepoOrchestrator(project_path=project.absolute(), config=config)
+        config = ConfigManager.from_cache()
+        orchestrator = MonoRepoOrchestrator(project_path=project_abs, config=config)
 
         # Verify CLI availability
         console.print("[dim]Checking AI CLI availability...[/]")
@@ -909,13 +1420,9 @@ def recover(project: Path, session_id: Optional[str], all_crashed: bool):
         if all_crashed:
             # Find all sessions with dead processes
             console.print("[dim]Scanning for crashed sessions...[/]")
-            all_sessions = session_manager.list_sessions()
-
-            for session_info in all_sessions:
-                # Check if session has dead PIDs
-                if session_info.cli_pids and not session_manager._is_session_active(session_info):
-                    sessions_to_recover.append(session_info)
-                    logger.debug(f"Found crashed session: {session_info.session_id}")
+            sessions_to_recover = session_manager.list_crashed_sessions(load_history=False)
+            for session_info in sessions_to_recover:
+                logger.debug(f"Found crashed session: {session_info.session_id}")
 
             if not sessions_to_recover:
                 console.print("[green]✓ No crashed sessions found[/]")
@@ -935,20 +1442,26 @@ def recover(project: Path, session_id: Optional[str], all_crashed: bool):
 
         else:
             # Recover session for current project
-            console.print(f"[dim]Project: {project.absolute()}[/]")
-            session_info = session_manager.get_session_by_project(project.absolute())
+            project_abs = project.absolute()
+            console.print(f"[dim]Project: {project_abs}[/]")
+            session_info = session_manager.get_session_by_project(project_abs)
             if not session_info:
                 console.print("[yellow]No session found for this project[/]")
                 logger.warning(f"No session found for project: {project}")
                 return
             sessions_to_recover = [session_info]
 
-        # Recover each session
+        # Recover each session, collecting one table row per session
+        from rich.table import Table
+
+        table = Table(show_header=True, header_style="bold magenta")
+        table.add_column("Session ID", style="cyan")
+        table.add_column("Result")
+
         recovered_count = 0
         failed_count = 0
 
         for session_info in sessions_to_recover:
-            console.print(f"[cyan]Recovering session: {session_info.session_id}[/]")
             logger.info(f"Recovering session: {session_info.session_id}")
 
             try:
@@ -956,24 +1469,25 @@ def recover(project: Path, session_id: Optional[str], all_crashed: bool):
                 recovered = session_manager.recover_session(session_info.session_id)
 
                 if recovered:
-                    console.print(f"[green]✓ Session {session_info.session_id} recovered[/]")
+                    table.add_row(session_info.session_id, "[green]✓ recovered[/]")
                     logger.info(f"Successfully recovered session: {session_info.session_id}")
                     recovered_count += 1
                 else:
-                    console.print(f"[red]✗ Failed to recover session {session_info.session_id}[/]")
+                    table.add_row(session_info.session_id, "[red]✗ failed to recover[/]")
                     logger.error(f"Failed to recover session: {session_info.session_id}")
                     failed_count += 1
 
             except SessionManagerError as e:
-                console.print(f"[red]✗ Error recovering {session_info.session_id}: {e}[/]")
+                table.add_row(session_info.session_id, f"[red]✗ error: {e}[/]")
                 logger.error(f"Error recovering session {session_info.session_id}: {e}")
                 failed_count += 1
 
-        # Summary
-        console.print(f"\n[bold]Recovery Summary:[/]")
-        console.print(f"[green]✓ Recovered: {recovered_count}[/]")
+        # Results and summary
+        summary = ["\n[bold]Recovery Summary:[/]", f"[green]✓ Recovered: {recovered_count}[/]"]
         if failed_count > 0:
-            console.print(f"[red]✗ Failed: {failed_count}[/]")
+            summary.append(f"[red]✗ Failed: {failed_count}[/]")
+        console.print(table)
+        console.print("\n".join(summary))
 
         logger.info(f"Recovery completed: {recovered_count} recovered, {failed_count} failed")
 
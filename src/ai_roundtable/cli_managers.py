@@ -1,13 +1,20 @@
 """AI CLI process managers using pexpect for I/O handling."""
 
-import queue
+import codecs
+import os
 import random
+import re
+import selectors
+import shutil
+import signal
+import subprocess
 import threading
 import time
 from abc import ABC, abstractmethod
+from collections import deque
 from enum import Enum
 from pathlib import Path
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, Generator, Iterator, Optional, Tuple
 
 import pexpect
 from pexpect import EOF, TIMEOUT
@@ -66,7 +73,7 @@ def retry_with_exponential_backoff(
         initial_delay: Initial delay in seconds
         max_delay: Maximum delay in seconds
         exponential_base: Base for exponential calculation
-        jitter: Whether to add random jitter to delay
+        jitter: Whether to pick the delay uniformly between 0 and the backoff cap
         retryable_exceptions: Tuple of exceptions that trigger retry
 
     Returns:
@@ -76,7 +83,6 @@ def retry_with_exponential_backoff(
     def decorator(func: Callable) -> Callable:
         def wrapper(*args, **kwargs):
             retries = 0
-            delay = initial_delay
 
             while True:
                 try:
@@ -90,12 +96,11 @@ def retry_with_exponential_backoff(
                         )
                         raise
 
-                    # Calculate delay with exponential backoff
-                    delay = min(initial_delay * (exponential_base**retries), max_delay)
+                    # Exponential backoff; the first retry waits up to initial_delay
+                    cap = min(initial_delay * (exponential_base ** (retries - 1)), max_delay)
 
-                    # Add jitter if enabled
-                    if jitter:
-                        delay = delay * (0.5 + random.random())
+                    # Full jitter, so managers failing together do not retry in lockstep
+                    delay = random.uniform(0, cap) if jitter else cap
 
                     logger.warning(
                         f"Retry {retries}/{max_retries} for {func.__name__} after {delay:.2f}s: {e}"
@@ -108,6 +113,53 @@ def retry_with_exponential_backoff(
     return decorator
 
 
+class _IOReactor:
+    """
+    Shared thread that reads output for every interactive CLI process.
+
+    One selector waits on the pexpect child fds of all registered managers,
+    so output is read as soon as it arrives and idle managers cost nothing,
+    however many CLIs are running.
+    """
+
+    _instance: Optional["_IOReactor"] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self):
+        self._selector = selectors.DefaultSelector()
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, daemon=True, name="cli-io-reactor")
+        self._thread.start()
+
+    @classmethod
+    def instance(cls) -> "_IOReactor":
+        """Get the process-wide reactor, starting its thread on first use."""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    def register(self, fd: int, manager: "AICliManager") -> None:
+        """Dispatch readiness of fd to manager._on_output_ready."""
+        with self._lock:
+            self._selector.register(fd, selectors.EVENT_READ, manager)
+
+    def unregister(self, fd: int) -> None:
+        """Stop watching fd (no-op if it is not registered)."""
+        with self._lock:
+            try:
+                self._selector.unregister(fd)
+            except (KeyError, ValueError):
+                pass
+
+    def _run(self) -> None:
+        while True:
+            # The timeout only matters for selectors that do not see fds
+            # registered while a select is already in progress
+            for key, _ in self._selector.select(timeout=1.0):
+                key.data._on_output_ready()
+
+
 class AICliManager(ABC):
     """
     Base class for managing AI CLI processes with pexpect.
@@ -115,6 +167,33 @@ class AICliManager(ABC):
     Handles process lifecycle, I/O management, and error recovery.
     """
 
+    __slots__ = (
+        "cli_name",
+        "config",
+        "project_path",
+        "process",
+        "state",
+        "output_buffer",
+        "_output_ready",
+        "_io_fd",
+        "_last_output_at",
+        "_lock",
+        "_io_lock",
+        "_subprocesses",
+        "timeout",
+        "init_command",
+        "prompt_pattern",
+        "_prompt_re",
+        "breaker_threshold",
+        "breaker_cooldown",
+        "_consecutive_failures",
+        "_breaker_open_until",
+    )
+
+    # Seconds after reactor-observed output during which health_check
+    # trusts the process to be alive
+    HEALTHY_OUTPUT_WINDOW = 5.0
+
     def __init__(self, cli_name: str, config: Dict[str, Any], project_path: Path):
         """
         Initialize AI CLI manager.
@@ -129,15 +208,28 @@ class AICliManager(ABC):
         self.project_path = Path(project_path)
         self.process: Optional[pexpect.spawn] = None
         self.state = ProcessState.STOPPED
-        self.io_thread: Optional[threading.Thread] = None
-        self.output_queue: queue.Queue = queue.Queue()
-        self._stop_event = threading.Event()
-        self._lock = threading.Lock()
+        # Output read by the I/O reactor; oldest chunks drop once full
+        self.output_buffer: deque = deque(maxlen=4096)
+        self._output_ready = threading.Event()
+        self._io_fd: Optional[int] = None  # child fd registered with _IOReactor
+        self._last_output_at = 0.0  # time.monotonic() of the last reactor read
+        self._lock = threading.Lock()  # process lifecycle and state
+        self._io_lock = threading.Lock()  # one command round trip at a time
+        # One-shot processes started by _stream_subprocess and still running
+        self._subprocesses: set[subprocess.Popen] = set()
 
         # Get configuration
         self.timeout = config.get("timeout", 60)
         self.init_command = config.get("init_command", "")
         self.prompt_pattern = config.get("prompt_pattern", r"[\$#>] ")
+        # Compiled once; DOTALL matches how pexpect compiles string patterns
+        self._prompt_re = re.compile(self.prompt_pattern, re.DOTALL)
+
+        # Circuit breaker for send_command_with_retry
+        self.breaker_threshold = config.get("breaker_threshold", 3)
+        self.breaker_cooldown = config.get("breaker_cooldown", 30)
+        self._consecutive_failures = 0
+        self._breaker_open_until = 0.0
 
     @abstractmethod
     def get_spawn_command(self) -> list[str]:
@@ -180,7 +272,6 @@ class AICliManager(ABC):
 
                 # Spawn process with proper terminal environment
                 command = self.get_spawn_command()
-                import os
                 env = os.environ.copy()
                 env['TERM'] = 'xterm-256color'
 
@@ -195,14 +286,14 @@ class AICliManager(ABC):
 
                 # Wait for initial prompt
                 startup_timeout = self.get_startup_timeout()
-                self._wait_for_prompt(timeout=startup_timeout)
+                self._wait_for_prompt(self.process, timeout=startup_timeout)
 
                 # Send initialization command if configured
                 if self.init_command:
                     self.send_command(self.init_command)
 
-                # Start I/O monitoring thread
-                self._start_io_thread()
+                # Hand output monitoring to the shared I/O reactor
+                self._register_io()
 
                 self.state = ProcessState.RUNNING
                 logger.info(f"{self.cli_name} started successfully")
@@ -245,17 +336,24 @@ class AICliManager(ABC):
         if timeout is None:
             timeout = self.timeout
 
+        # Captured once: stop() may clear or close self.process mid-response
+        process = self.process
+        if process is None:
+            raise AICliProcessError(f"{self.cli_name} is not running")
+
         try:
-            with self._lock:
+            # Serializes commands only; state changes (stop) use self._lock
+            # and do not wait for an in-flight response
+            with self._io_lock:
                 # Send command
-                self.process.sendline(command)
+                process.sendline(command)
                 logger.debug(f"Sent to {self.cli_name}: {command}")
 
                 # Wait for prompt
-                self._wait_for_prompt(timeout=timeout)
+                self._wait_for_prompt(process, timeout=timeout)
 
                 # Get output (everything before the prompt)
-                output = self.process.before
+                output = process.before
                 if output:
                     output = output.strip()
                     logger.debug(f"Received from {self.cli_name}: {output[:100]}...")
@@ -267,16 +365,148 @@ class AICliManager(ABC):
                 f"Command timed out after {timeout}s: {command[:50]}"
             )
 
-        except EOF:
-            self.state = ProcessState.ERROR
+        except (EOF, ValueError, OSError):
+            # EOF when the CLI exits; ValueError/OSError when stop() closed
+            # the process (and its fd) while we were waiting
+            if self.state == ProcessState.RUNNING:
+                self.state = ProcessState.ERROR
             raise AICliProcessError(f"{self.cli_name} process terminated unexpectedly")
 
-    @retry_with_exponential_backoff(
-        max_retries=3,
-        initial_delay=1.0,
-        max_delay=10.0,
-        retryable_exceptions=(AICliTimeoutError,),
-    )
+    def stream_command(
+        self, command: str, timeout: Optional[int] = None
+    ) -> Iterator[str]:
+        """
+        Send command to CLI and yield the response as it is produced.
+
+        The base implementation yields the complete send_command output once.
+        Managers that run a subprocess per command override this to yield
+        stdout as it arrives.
+
+        Args:
+            command: Command to send
+            timeout: Timeout in seconds (uses default if None)
+
+        Returns:
+            Iterator of response text chunks
+
+        Raises:
+            AICliTimeoutError: If command times out
+            AICliProcessError: If process is not running
+        """
+        output = self.send_command(command, timeout)
+        if output:
+            yield output
+
+    def _stream_subprocess(
+        self, cmd: list[str], timeout: int, command: str
+    ) -> Generator[str, None, Tuple[int, str, bool]]:
+        """
+        Run a one-shot CLI command, yielding stdout as it arrives.
+
+        stdout and stderr are multiplexed on one selector, so a chatty CLI
+        cannot block on a full stderr pipe and no reader thread is needed.
+        The process is killed if the caller stops iterating early or the
+        timeout expires.
+
+        Args:
+            cmd: Command line to run in the project directory
+            timeout: Overall timeout in seconds
+            command: Prompt being sent (for error messages)
+
+        Returns:
+            Generator of decoded stdout chunks whose return value is
+            (returncode, stderr text, whether stdout had non-blank output)
+
+        Raises:
+            AICliTimeoutError: If the command does not finish in time
+        """
+        # Own process group, so a timeout also kills any tool processes the
+        # CLI spawned (they would otherwise keep the pipes open)
+        process = subprocess.Popen(
+            cmd,
+            stdin=subprocess.DEVNULL,  # Prevent hanging on stdin
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            cwd=str(self.project_path),
+            start_new_session=True,
+        )
+        # Registered so stop() can kill it: being in its own session, the
+        # CLI does not get the terminal's Ctrl+C
+        with self._lock:
+            self._subprocesses.add(process)
+        stderr_chunks = []
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        deadline = time.monotonic() + timeout
+        stdout_fd = process.stdout.fileno()
+        has_output = False
+
+        try:
+            with selectors.DefaultSelector() as selector:
+                selector.register(stdout_fd, selectors.EVENT_READ)
+                selector.register(process.stderr.fileno(), selectors.EVENT_READ)
+                while selector.get_map():
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise AICliTimeoutError(
+                            f"Command timed out after {timeout}s: {command[:50]}"
+                        )
+
+                    for key, _ in selector.select(remaining):
+                        data = os.read(key.fd, 65536)
+                        if not data:
+                            selector.unregister(key.fd)
+                        elif key.fd != stdout_fd:
+                            stderr_chunks.append(data)
+                        else:
+                            text = decoder.decode(data)
+                            if text:
+                                has_output = has_output or not text.isspace()
+                                yield text
+
+            text = decoder.decode(b"", final=True)
+            if text:
+                has_output = has_output or not text.isspace()
+                yield text
+
+            try:
+                returncode = process.wait(timeout=max(deadline - time.monotonic(), 0))
+            except subprocess.TimeoutExpired:
+                raise AICliTimeoutError(
+                    f"Command timed out after {timeout}s: {command[:50]}"
+                )
+
+            stderr = b"".join(stderr_chunks).decode("utf-8", errors="replace")
+            return returncode, stderr, has_output
+
+        finally:
+            with self._lock:
+                self._subprocesses.discard(process)
+            if process.poll() is None:
+                try:
+                    os.killpg(process.pid, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
+                process.wait()
+            process.stdout.close()
+            process.stderr.close()
+
+    def _kill_subprocesses(self, force: bool = False) -> None:
+        """
+        Kill the process groups of in-flight one-shot commands.
+
+        Their _stream_subprocess calls then see EOF and return promptly.
+        Must be called with self._lock held.
+
+        Args:
+            force: If True, use SIGKILL instead of SIGTERM
+        """
+        sig = signal.SIGKILL if force else signal.SIGTERM
+        for process in self._subprocesses:
+            try:
+                os.killpg(process.pid, sig)
+            except ProcessLookupError:
+                pass
+
     def send_command_with_retry(
         self, command: str, timeout: Optional[int] = None
     ) -> Optional[str]:
@@ -285,6 +515,8 @@ class AICliManager(ABC):
 
         Uses exponential backoff strategy for retries. This is the recommended
         method for sending commands as it handles transient failures gracefully.
+        After `breaker_threshold` consecutive commands exhaust their retries,
+        further commands fail fast for `breaker_cooldown` seconds.
 
         Args:
             command: Command to send
@@ -295,64 +527,94 @@ class AICliManager(ABC):
 
         Raises:
             AICliTimeoutError: If all retries exhausted
-            AICliProcessError: If process is not running
+            AICliProcessError: If process is not running or the breaker is open
         """
+        remaining = self._breaker_open_until - time.monotonic()
+        if remaining > 0:
+            raise AICliProcessError(
+                f"{self.cli_name} circuit open after {self._consecutive_failures} "
+                f"consecutive timeouts, retry in {remaining:.0f}s"
+            )
+
+        try:
+            result = self._send_command_retrying(command, timeout)
+        except AICliTimeoutError:
+            self._consecutive_failures += 1
+            if self._consecutive_failures >= self.breaker_threshold:
+                self._breaker_open_until = time.monotonic() + self.breaker_cooldown
+                logger.warning(
+                    f"{self.cli_name} circuit opened for {self.breaker_cooldown}s "
+                    f"after {self._consecutive_failures} consecutive timeouts"
+                )
+            raise
+
+        self._consecutive_failures = 0
+        return result
+
+    @retry_with_exponential_backoff(
+        max_retries=3,
+        initial_delay=1.0,
+        max_delay=10.0,
+        retryable_exceptions=(AICliTimeoutError,),
+    )
+    def _send_command_retrying(self, command: str, timeout: Optional[int]) -> Optional[str]:
+        """send_command with the backoff policy applied (see send_command_with_retry)."""
         return self.send_command(command, timeout)
 
-    def _wait_for_prompt(self, timeout: int) -> None:
+    def _wait_for_prompt(self, process: pexpect.spawn, timeout: int) -> None:
         """
         Wait for CLI prompt pattern.
 
         Args:
+            process: Process to read from (the caller's reference, which
+                stays valid if stop() clears self.process meanwhile)
             timeout: Timeout in seconds
 
         Raises:
             TIMEOUT: If prompt not found within timeout
             EOF: If process terminates
         """
-        self.process.expect(self.prompt_pattern, timeout=timeout)
+        process.expect(self._prompt_re, timeout=timeout)
 
-    def _start_io_thread(self) -> None:
-        """Start background I/O monitoring thread."""
-        self._stop_event.clear()
-        self.io_thread = threading.Thread(
-            target=self._io_monitor, daemon=True, name=f"{self.cli_name}-io"
-        )
-        self.io_thread.start()
-        logger.debug(f"Started I/O thread for {self.cli_name}")
+    def _register_io(self) -> None:
+        """Start monitoring process output on the shared I/O reactor."""
+        self._io_fd = self.process.child_fd
+        _IOReactor.instance().register(self._io_fd, self)
+        logger.debug(f"Registered {self.cli_name} with the I/O reactor")
 
-    def _io_monitor(self) -> None:
-        """
-        Background I/O monitoring thread.
+    def _unregister_io(self) -> None:
+        """Stop monitoring process output (no-op if not monitored)."""
+        if self._io_fd is not None:
+            _IOReactor.instance().unregister(self._io_fd)
+            self._io_fd = None
 
-        Continuously reads process output and puts it in queue.
+    def _on_output_ready(self) -> None:
         """
-        logger.debug(f"I/O monitor started for {self.cli_name}")
-
-        while not self._stop_event.is_set() and self.state == ProcessState.RUNNING:
-            try:
-                if self.process and self.process.isalive():
-                    # Non-blocking read with small timeout
-                    try:
-                        output = self.process.read_nonblocking(size=1024, timeout=0.1)
-                        if output:
-                            self.output_queue.put(output)
-                    except TIMEOUT:
-                        # No output available, continue
-                        pass
-                else:
-                    # Process died
-                    logger.warning(f"{self.cli_name} process died")
-                    self.state = ProcessState.ERROR
-                    break
-
-            except Exception as e:
-                logger.error(f"Error in I/O monitor for {self.cli_name}: {e}")
-                break
+        Read available process output into the output buffer.
 
-            time.sleep(0.1)
+        Called on the I/O reactor thread when the child fd is readable.
+        """
+        process = self.process
+        if process is None:
+            return
 
-        logger.debug(f"I/O monitor stopped for {self.cli_name}")
+        try:
+            # Large reads drain a flood of output in few wakeups
+            output = process.read_nonblocking(size=65536, timeout=0)
+            if output:
+                self._last_output_at = time.monotonic()
+                self.output_buffer.append(output)
+                self._output_ready.set()
+        except TIMEOUT:
+            # Readiness was consumed elsewhere, continue
+            pass
+        except EOF:
+            logger.warning(f"{self.cli_name} process closed its output")
+            self.state = ProcessState.ERROR
+            self._unregister_io()
+        except Exception as e:
+            logger.error(f"Error in I/O monitor for {self.cli_name}: {e}")
+            self._unregister_io()
 
     def stop(self, force: bool = False) -> None:
         """
@@ -367,10 +629,8 @@ class AICliManager(ABC):
 
             logger.info(f"Stopping {self.cli_name}...")
 
-            # Stop I/O thread
-            self._stop_event.set()
-            if self.io_thread and self.io_thread.is_alive():
-                self.io_thread.join(timeout=2.0)
+            # Stop monitoring output before the process goes away
+            self._unregister_io()
 
             # Terminate process
             if self.process and self.process.isalive():
@@ -390,6 +650,7 @@ class AICliManager(ABC):
 
     def _cleanup(self) -> None:
         """Clean up resources."""
+        self._unregister_io()
         if self.process:
             try:
                 self.process.close(force=True)
@@ -397,12 +658,22 @@ class AICliManager(ABC):
                 pass
             self.process = None
 
-        # Clear queue
-        while not self.output_queue.empty():
-            try:
-                self.output_queue.get_nowait()
-            except queue.Empty:
-                break
+        self.output_buffer.clear()
+        self._output_ready.clear()
+
+    def drain_output(self) -> str:
+        """
+        Take all process output read so far by the I/O reactor.
+
+        Returns:
+            Concatenated output chunks (empty string if none)
+        """
+        # Clear first, so output appended while draining sets it again
+        self._output_ready.clear()
+        chunks = []
+        while self.output_buffer:
+            chunks.append(self.output_buffer.popleft())
+        return "".join(chunks)
 
     def is_alive(self) -> bool:
         """
@@ -436,9 +707,8 @@ class AICliManager(ABC):
             try:
                 logger.debug(f"Restart attempt {attempt}/{max_attempts}")
 
-                # Stop current process
+                # Stop current process (returns once it has exited)
                 self.stop()
-                time.sleep(1)  # Brief pause before restart
 
                 # Start new process
                 if self.start():
@@ -500,6 +770,14 @@ class AICliManager(ABC):
         Returns:
             True if process is healthy, False otherwise
         """
+        # Output seen by the I/O reactor moments ago proves the process is
+        # alive (EOF would have moved it out of RUNNING) without a waitpid
+        if (
+            self.state == ProcessState.RUNNING
+            and time.monotonic() - self._last_output_at < self.HEALTHY_OUTPUT_WINDOW
+        ):
+            return True
+
         if not self.is_alive():
             logger.warning(f"{self.cli_name} health check failed: process not alive")
             return False
@@ -530,6 +808,8 @@ class ClaudeCodeManager(AICliManager):
     This is much more reliable than trying to automate the interactive TUI.
     """
 
+    __slots__ = ("_session_started", "_use_print_mode")
+
     def __init__(self, cli_name: str, config: Dict[str, Any], project_path: Path):
         """Initialize Claude Code manager with print mode support."""
         super().__init__(cli_name, config, project_path)
@@ -561,15 +841,7 @@ class ClaudeCodeManager(AICliManager):
                 logger.info(f"Starting {self.cli_name} (print mode)...")
 
                 # Verify claude command is available
-                import subprocess
-                result = subprocess.run(
-                    ["which", "claude"],
-                    capture_output=True,
-                    text=True,
-                    timeout=10
-                )
-
-                if result.returncode != 0:
+                if shutil.which("claude") is None:
                     raise AICliProcessError("Claude Code CLI not found in PATH")
 
                 self._session_started = False
@@ -577,21 +849,17 @@ class ClaudeCodeManager(AICliManager):
                 logger.info(f"{self.cli_name} ready (print mode)")
                 return True
 
-            except subprocess.TimeoutExpired:
-                self.state = ProcessState.ERROR
-                raise AICliProcessError("Timeout checking for Claude Code CLI")
-
             except Exception as e:
                 self.state = ProcessState.ERROR
                 error_msg = f"Failed to start {self.cli_name}: {e}"
                 logger.error(error_msg)
                 raise AICliProcessError(error_msg)
 
-    def send_command(
+    def stream_command(
         self, command: str, timeout: Optional[int] = None
-    ) -> Optional[str]:
+    ) -> Iterator[str]:
         """
-        Send command to Claude Code using print mode.
+        Send command to Claude Code using print mode, yielding output as it arrives.
 
         Uses `claude -p "prompt"` for first message, then
         `claude -p "prompt" --continue` for subsequent messages.
@@ -601,14 +869,12 @@ class ClaudeCodeManager(AICliManager):
             timeout: Timeout in seconds (uses default if None)
 
         Returns:
-            Claude's response text
+            Iterator of Claude's response text chunks
 
         Raises:
             AICliTimeoutError: If command times out
             AICliProcessError: If not running or command fails
         """
-        import subprocess
-
         if self.state != ProcessState.RUNNING:
             raise AICliProcessError(f"{self.cli_name} is not running")
 
@@ -629,46 +895,55 @@ class ClaudeCodeManager(AICliManager):
 
             logger.debug(f"Running: {' '.join(cmd[:3])}...")  # Don't log full prompt
 
-            # Run command and capture output
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-                cwd=str(self.project_path),
-                stdin=subprocess.DEVNULL  # Prevent hanging on stdin
-            )
+            # Run command and stream output
+            returncode, stderr, _ = yield from self._stream_subprocess(cmd, timeout, command)
 
             # Mark session as started for future --continue
             self._session_started = True
 
-            if result.returncode != 0:
-                error_msg = result.stderr.strip() if result.stderr else "Unknown error"
+            if returncode != 0:
+                error_msg = stderr.strip() if stderr else "Unknown error"
                 logger.error(f"Claude Code error: {error_msg}")
                 raise AICliProcessError(f"Claude Code returned error: {error_msg}")
 
-            output = result.stdout.strip()
-            logger.debug(f"Received from {self.cli_name}: {output[:100]}...")
-            return output
-
-        except subprocess.TimeoutExpired:
-            raise AICliTimeoutError(
-                f"Command timed out after {timeout}s: {command[:50]}"
-            )
-
-        except AICliProcessError:
+        except (AICliTimeoutError, AICliProcessError):
             raise
 
         except Exception as e:
             raise AICliProcessError(f"Error running Claude Code: {e}")
 
+    def send_command(
+        self, command: str, timeout: Optional[int] = None
+    ) -> Optional[str]:
+        """
+        Send command to Claude Code using print mode.
+
+        Collects the output of stream_command.
+
+        Args:
+            command: The prompt/question to send
+            timeout: Timeout in seconds (uses default if None)
+
+        Returns:
+            Claude's response text
+
+        Raises:
+            AICliTimeoutError: If command times out
+            AICliProcessError: If not running or command fails
+        """
+        output = "".join(self.stream_command(command, timeout)).strip()
+        logger.debug(f"Received from {self.cli_name}: {output[:100]}...")
+        return output
+
     def stop(self, force: bool = False) -> None:
         """
         Close Claude Code session.
 
-        In print mode, we just reset state (no process to kill).
+        In print mode there is no long-running process; any query still
+        running is killed so callers waiting on it return promptly.
         """
         with self._lock:
+            self._kill_subprocesses(force)
             if self.state == ProcessState.STOPPED:
                 return
 
@@ -698,6 +973,8 @@ class CodexManager(AICliManager):
     This is much more reliable than trying to automate the interactive TUI.
     """
 
+    __slots__ = ("_use_exec_mode",)
+
     def __init__(self, cli_name: str, config: Dict[str, Any], project_path: Path):
         """Initialize Codex manager with exec mode support."""
         super().__init__(cli_name, config, project_path)
@@ -728,36 +1005,24 @@ class CodexManager(AICliManager):
                 logger.info(f"Starting {self.cli_name} (exec mode)...")
 
                 # Verify codex command is available
-                import subprocess
-                result = subprocess.run(
-                    ["which", "codex"],
-                    capture_output=True,
-                    text=True,
-                    timeout=10
-                )
-
-                if result.returncode != 0:
+                if shutil.which("codex") is None:
                     raise AICliProcessError("Codex CLI not found in PATH")
 
                 self.state = ProcessState.RUNNING
                 logger.info(f"{self.cli_name} ready (exec mode)")
                 return True
 
-            except subprocess.TimeoutExpired:
-                self.state = ProcessState.ERROR
-                raise AICliProcessError("Timeout checking for Codex CLI")
-
             except Exception as e:
                 self.state = ProcessState.ERROR
                 error_msg = f"Failed to start {self.cli_name}: {e}"
                 logger.error(error_msg)
                 raise AICliProcessError(error_msg)
 
-    def send_command(
+    def stream_command(
         self, command: str, timeout: Optional[int] = None
-    ) -> Optional[str]:
+    ) -> Iterator[str]:
         """
-        Send command to Codex using exec mode.
+        Send command to Codex using exec mode, yielding output as it arrives.
 
         Uses `codex exec "prompt"` for non-interactive execution.
         Output goes to stdout, activity/progress goes to stderr.
@@ -767,14 +1032,12 @@ class CodexManager(AICliManager):
             timeout: Timeout in seconds (uses default if None)
 
         Returns:
-            Codex's response text (stdout)
+            Iterator of Codex's response text chunks (stdout)
 
         Raises:
             AICliTimeoutError: If command times out
             AICliProcessError: If not running or command fails
         """
-        import subprocess
-
         if self.state != ProcessState.RUNNING:
             raise AICliProcessError(f"{self.cli_name} is not running")
 
@@ -791,45 +1054,55 @@ class CodexManager(AICliManager):
 
             logger.debug(f"Running: codex exec ...")
 
-            # Run command and capture output
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-                cwd=str(self.project_path),
-                stdin=subprocess.DEVNULL  # Prevent hanging on stdin
-            )
-
+            # Run command and stream output
             # Codex exec: stdout = final response, stderr = activity
-            output = result.stdout.strip()
+            returncode, stderr, has_output = yield from self._stream_subprocess(
+                cmd, timeout, command
+            )
 
-            if result.returncode != 0 and not output:
-                error_msg = result.stderr.strip() if result.stderr else "Unknown error"
+            if returncode != 0 and not has_output:
+                error_msg = stderr.strip() if stderr else "Unknown error"
                 logger.error(f"Codex error: {error_msg}")
                 raise AICliProcessError(f"Codex returned error: {error_msg}")
 
-            logger.debug(f"Received from {self.cli_name}: {output[:100]}...")
-            return output
-
-        except subprocess.TimeoutExpired:
-            raise AICliTimeoutError(
-                f"Command timed out after {timeout}s: {command[:50]}"
-            )
-
-        except AICliProcessError:
+        except (AICliTimeoutError, AICliProcessError):
             raise
 
         except Exception as e:
             raise AICliProcessError(f"Error running Codex: {e}")
 
+    def send_command(
+        self, command: str, timeout: Optional[int] = None
+    ) -> Optional[str]:
+        """
+        Send command to Codex using exec mode.
+
+        Collects the output of stream_command.
+
+        Args:
+            command: The prompt/question to send
+            timeout: Timeout in seconds (uses default if None)
+
+        Returns:
+            Codex's response text (stdout)
+
+        Raises:
+            AICliTimeoutError: If command times out
+            AICliProcessError: If not running or command fails
+        """
+        output = "".join(self.stream_command(command, timeout)).strip()
+        logger.debug(f"Received from {self.cli_name}: {output[:100]}...")
+        return output
+
     def stop(self, force: bool = False) -> None:
         """
         Close Codex session.
 
-        In exec mode, we just reset state (no process to kill).
+        In exec mode there is no long-running process; any query still
+        running is killed so callers waiting on it return promptly.
         """
         with self._lock:
+            self._kill_subprocesses(force)
             if self.state == ProcessState.STOPPED:
                 return
 
@@ -853,6 +1126,8 @@ class GeminiManager(AICliManager):
     This is much more reliable than trying to automate the interactive TUI.
     """
 
+    __slots__ = ("_use_noninteractive", "_model")
+
     def __init__(self, cli_name: str, config: Dict[str, Any], project_path: Path):
         """Initialize Gemini manager with non-interactive mode support."""
         super().__init__(cli_name, config, project_path)
@@ -884,36 +1159,24 @@ class GeminiManager(AICliManager):
                 logger.info(f"Starting {self.cli_name} (non-interactive mode)...")
 
                 # Verify gemini command is available
-                import subprocess
-                result = subprocess.run(
-                    ["which", "gemini"],
-                    capture_output=True,
-                    text=True,
-                    timeout=10
-                )
-
-                if result.returncode != 0:
+                if shutil.which("gemini") is None:
                     raise AICliProcessError("Gemini CLI not found in PATH")
 
                 self.state = ProcessState.RUNNING
                 logger.info(f"{self.cli_name} ready (non-interactive mode, model: {self._model})")
                 return True
 
-            except subprocess.TimeoutExpired:
-                self.state = ProcessState.ERROR
-                raise AICliProcessError("Timeout checking for Gemini CLI")
-
             except Exception as e:
                 self.state = ProcessState.ERROR
                 error_msg = f"Failed to start {self.cli_name}: {e}"
                 logger.error(error_msg)
                 raise AICliProcessError(error_msg)
 
-    def send_command(
+    def stream_command(
         self, command: str, timeout: Optional[int] = None
-    ) -> Optional[str]:
+    ) -> Iterator[str]:
         """
-        Send command to Gemini using non-interactive mode.
+        Send command to Gemini using non-interactive mode, yielding output as it arrives.
 
         Uses `gemini "prompt" --yolo` for non-interactive execution.
 
@@ -922,14 +1185,12 @@ class GeminiManager(AICliManager):
             timeout: Timeout in seconds (uses default if None)
 
         Returns:
-            Gemini's response text
+            Iterator of Gemini's response text chunks
 
         Raises:
             AICliTimeoutError: If command times out
             AICliProcessError: If not running or command fails
         """
-        import subprocess
-
         if self.state != ProcessState.RUNNING:
             raise AICliProcessError(f"{self.cli_name} is not running")
 
@@ -948,44 +1209,54 @@ class GeminiManager(AICliManager):
 
             logger.debug(f"Running: gemini ... -m {self._model} --yolo")
 
-            # Run command and capture output
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-                cwd=str(self.project_path),
-                stdin=subprocess.DEVNULL  # Prevent hanging on stdin
+            # Run command and stream output
+            returncode, stderr, has_output = yield from self._stream_subprocess(
+                cmd, timeout, command
             )
 
-            output = result.stdout.strip()
-
-            if result.returncode != 0 and not output:
-                error_msg = result.stderr.strip() if result.stderr else "Unknown error"
+            if returncode != 0 and not has_output:
+                error_msg = stderr.strip() if stderr else "Unknown error"
                 logger.error(f"Gemini error: {error_msg}")
                 raise AICliProcessError(f"Gemini returned error: {error_msg}")
 
-            logger.debug(f"Received from {self.cli_name}: {output[:100]}...")
-            return output
-
-        except subprocess.TimeoutExpired:
-            raise AICliTimeoutError(
-                f"Command timed out after {timeout}s: {command[:50]}"
-            )
-
-        except AICliProcessError:
+        except (AICliTimeoutError, AICliProcessError):
             raise
 
         except Exception as e:
             raise AICliProcessError(f"Error running Gemini: {e}")
 
+    def send_command(
+        self, command: str, timeout: Optional[int] = None
+    ) -> Optional[str]:
+        """
+        Send command to Gemini using non-interactive mode.
+
+        Collects the output of stream_command.
+
+        Args:
+            command: The prompt/question to send
+            timeout: Timeout in seconds (uses default if None)
+
+        Returns:
+            Gemini's response text
+
+        Raises:
+            AICliTimeoutError: If command times out
+            AICliProcessError: If not running or command fails
+        """
+        output = "".join(self.stream_command(command, timeout)).strip()
+        logger.debug(f"Received from {self.cli_name}: {output[:100]}...")
+        return output
+
     def stop(self, force: bool = False) -> None:
         """
         Close Gemini session.
 
-        In non-interactive mode, we just reset state (no process to kill).
+        In non-interactive mode there is no long-running process; any query still
+        running is killed so callers waiting on it return promptly.
         """
         with self._lock:
+            self._kill_subprocesses(force)
             if self.state == ProcessState.STOPPED:
                 return
 
@@ -1,13 +1,23 @@
 """Configuration management for AI Roundtable."""
 
+import copy
+import functools
+import hashlib
 import os
 import tempfile
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, Optional
 import yaml
 
 from .logging_config import get_logger
 
+# libyaml-backed loader/dumper when PyYAML was built with it
+try:
+    from yaml import CSafeDumper as _Dumper, CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeDumper as _Dumper, SafeLoader as _Loader
+
 logger = get_logger(__name__)
 
 
@@ -47,12 +57,89 @@ DEFAULT_CONFIG = {
 }
 
 
+# Required config keys, as dotted paths in check order, with the type the
+# value must have (None: any). A parent is listed before its children.
+_SCHEMA = (
+    ("version", None),
+    ("default_mode", None),
+    ("cli_settings", dict),
+    ("context", dict),
+    ("session", dict),
+    ("context.max_tokens", None),
+    ("context.compression_threshold", None),
+    ("session.auto_save", None),
+)
+
+# Keys every cli_settings entry must have
+_CLI_KEYS = ("enabled", "timeout", "init_command", "prompt_pattern")
+
+_TYPE_NAMES = {dict: "dictionary"}
+
+# Private copy of the defaults; DEFAULT_CONFIG is public and could be edited
+_DEFAULT_TEMPLATE = copy.deepcopy(DEFAULT_CONFIG)
+
+
 class ConfigValidationError(Exception):
     """Raised when configuration validation fails."""
 
     pass
 
 
+def _default_config_path() -> Path:
+    """Get the default config file location (~/.ai-roundtable/config.yaml)."""
+    return Path.home() / ".ai-roundtable" / "config.yaml"
+
+
+@functools.lru_cache(maxsize=4)
+def _cached_manager(cls: type, path: str, mtime_ns: int, size: int) -> "ConfigManager":
+    """
+    Build a ConfigManager for path, memoized on the file's stat signature.
+
+    mtime_ns and size are only part of the cache key: any change to the file
+    on disk produces a new key and therefore a fresh load.
+    """
+    return cls(Path(path))
+
+
+def _default_config() -> Dict[str, Any]:
+    """Get a fresh default config that the caller may modify."""
+    return copy.deepcopy(_DEFAULT_TEMPLATE)
+
+
+def _deep_update(dst: Dict[str, Any], src: Dict[str, Any]) -> None:
+    """Merge src into dst in place, recursing where both sides hold a dict."""
+    for key, value in src.items():
+        current = dst.get(key)
+        if isinstance(current, dict) and isinstance(value, dict):
+            _deep_update(current, value)
+        else:
+            dst[key] = value
+
+
+def _fsync_dir(path: Path) -> None:
+    """Flush a directory's entries to disk (no-op where directories cannot be opened)."""
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+
+    fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_config_file(path: str, mtime_ns: int, size: int) -> Any:
+    """
+    Parse a YAML config file, memoized on the file's stat signature.
+
+    As with _cached_manager, mtime_ns and size are only part of the cache
+    key. The result is shared between calls and must not be mutated.
+    """
+    with open(path, "r") as f:
+        return yaml.load(f, Loader=_Loader)
+
+
 class ConfigManager:
     """
     Manages AI Roundtable configuration.
@@ -69,11 +156,42 @@ class ConfigManager:
             config_path: Path to config file. Defaults to ~/.ai-roundtable/config.yaml
         """
         if config_path is None:
-            config_path = Path.home() / ".ai-roundtable" / "config.yaml"
+            config_path = _default_config_path()
 
         self.config_path = Path(config_path)
+
+        # Ensure config directory exists (once; saves recreate it if removed)
+        self.config_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._txn_depth = 0  # nesting level of transaction()
+        self._dirty = False  # unsaved changes made inside a transaction
         self.config: Dict[str, Any] = self.load_config()
 
+    @classmethod
+    def from_cache(cls, config_path: Optional[Path] = None) -> "ConfigManager":
+        """
+        Get a shared ConfigManager, reusing the parsed config while the file is unchanged.
+
+        The cache is keyed on (path, st_mtime_ns, st_size), so edits to the
+        config file are picked up on the next call.
+
+        Args:
+            config_path: Path to config file. Defaults to ~/.ai-roundtable/config.yaml
+
+        Returns:
+            ConfigManager instance
+        """
+        if config_path is None:
+            config_path = _default_config_path()
+
+        try:
+            stat = os.stat(config_path)
+        except FileNotFoundError:
+            # First run: the constructor creates the default config file
+            return cls(config_path)
+
+        return _cached_manager(cls, str(config_path), stat.st_mtime_ns, stat.st_size)
+
     def load_config(self) -> Dict[str, Any]:
         """
         Load configuration from file or create default.
@@ -84,18 +202,17 @@ class ConfigManager:
         Raises:
             ConfigValidationError: If config file is invalid
         """
-        # Ensure config directory exists
-        self.config_path.parent.mkdir(parents=True, exist_ok=True)
-
         # Load existing config or create default
         if self.config_path.exists():
             try:
-                with open(self.config_path, "r") as f:
-                    config = yaml.safe_load(f)
+                stat = self.config_path.stat()
+                config = copy.deepcopy(
+                    _parse_config_file(str(self.config_path), stat.st_mtime_ns, stat.st_size)
+                )
 
                 if config is None:
                     # Empty file
-                    config = DEFAULT_CONFIG.copy()
+                    config = _default_config()
                     self.save_config(config)
                 else:
                     # Merge with defaults to ensure all keys exist
@@ -109,7 +226,7 @@ class ConfigManager:
                 raise ConfigValidationError(f"Error loading config: {e}")
         else:
             # Create default config
-            config = DEFAULT_CONFIG.copy()
+            config = _default_config()
             self.save_config(config)
             return config
 
@@ -123,18 +240,16 @@ class ConfigManager:
         Returns:
             Merged configuration with all default keys
         """
-        merged = DEFAULT_CONFIG.copy()
-
-        # Deep merge for nested dicts
-        for key, value in config.items():
-            if key in merged and isinstance(merged[key], dict) and isinstance(value, dict):
-                merged[key] = {**merged[key], **value}
-            else:
-                merged[key] = value
-
+        merged = _default_config()
+        _deep_update(merged, config)
         return merged
 
-    def save_config(self, config: Optional[Dict[str, Any]] = None) -> None:
+    def save_config(
+        self,
+        config: Optional[Dict[str, Any]] = None,
+        verify: bool = False,
+        expected_prev_sha256: Optional[str] = None,
+    ) -> None:
         """
         Save configuration to file with atomic write.
 
@@ -142,9 +257,15 @@ class ConfigManager:
 
         Args:
             config: Configuration to save. If None, saves current config.
+            verify: Read the temp file back and compare its SHA-256 with
+                what was written before replacing the config
+            expected_prev_sha256: Only save if the file on disk still has this
+                SHA-256 (see file_sha256), so concurrent edits are not lost
 
         Raises:
-            ConfigValidationError: If config validation fails
+            ConfigValidationError: If config validation fails, the file
+                changed since expected_prev_sha256 was taken, or the
+                read-back does not match
         """
         if config is None:
             config = self.config
@@ -154,33 +275,70 @@ class ConfigManager:
         # Validate before saving
         self._validate_config(config)
 
-        # Ensure directory exists
-        self.config_path.parent.mkdir(parents=True, exist_ok=True)
+        if expected_prev_sha256 is not None and self.file_sha256() != expected_prev_sha256:
+            raise ConfigValidationError(
+                f"Config file {self.config_path} changed since it was read; not saving"
+            )
 
-        # Atomic write: write to temp file then move
+        # Atomic write: write and fsync a temp file, rename it over the
+        # config, then fsync the directory so the rename itself is durable
+        tmp_path = None
         try:
+            data = yaml.dump(
+                config, Dumper=_Dumper, default_flow_style=False, sort_keys=False
+            ).encode("utf-8")
+
             # Create temp file in same directory to ensure same filesystem
-            with tempfile.NamedTemporaryFile(
-                mode="w",
-                dir=self.config_path.parent,
-                delete=False,
-                suffix=".tmp",
-            ) as tmp_file:
-                yaml.safe_dump(config, tmp_file, default_flow_style=False, sort_keys=False)
-                tmp_path = tmp_file.name
+            try:
+                fd, tmp_path = tempfile.mkstemp(dir=self.config_path.parent, suffix=".tmp")
+            except FileNotFoundError:
+                # Directory removed since __init__ created it
+                self.config_path.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(dir=self.config_path.parent, suffix=".tmp")
+            with os.fdopen(fd, "wb") as tmp_file:
+                tmp_file.write(data)
+                tmp_file.flush()
+                os.fsync(tmp_file.fileno())
+
+            if verify:
+                with open(tmp_path, "rb") as f:
+                    written = hashlib.file_digest(f, "sha256").hexdigest()
+                if written != hashlib.sha256(data).hexdigest():
+                    raise ConfigValidationError("write_corruption")
 
             # Atomic move
             os.replace(tmp_path, self.config_path)
+            tmp_path = None
+            _fsync_dir(self.config_path.parent)
+
+            self._dirty = False
+
+            # A rewrite within the filesystem's mtime granularity could keep
+            # the same stat signature, so do not trust the parse cache
+            _parse_config_file.cache_clear()
 
         except Exception as e:
             # Clean up temp file if it exists
-            if "tmp_path" in locals():
+            if tmp_path is not None:
                 try:
                     os.unlink(tmp_path)
-                except:
+                except OSError:
                     pass
             raise ConfigValidationError(f"Error saving config: {e}")
 
+    def file_sha256(self) -> Optional[str]:
+        """
+        Get the SHA-256 of the config file as it is on disk.
+
+        Returns:
+            Hex digest, or None if the file does not exist
+        """
+        try:
+            with open(self.config_path, "rb") as f:
+                return hashlib.file_digest(f, "sha256").hexdigest()
+        except FileNotFoundError:
+            return None
+
     def _validate_config(self, config: Dict[str, Any]) -> None:
         """
         Validate configuration structure.
@@ -191,40 +349,27 @@ class ConfigManager:
         Raises:
             ConfigValidationError: If validation fails
         """
-        required_keys = ["version", "default_mode", "cli_settings", "context", "session"]
-
-        for key in required_keys:
-            if key not in config:
-                raise ConfigValidationError(f"Missing required config key: {key}")
+        for path, required_type in _SCHEMA:
+            *parents, key = path.split(".")
+            section = config
+            for parent in parents:
+                section = section[parent]
 
-        # Validate CLI settings
-        if not isinstance(config["cli_settings"], dict):
-            raise ConfigValidationError("cli_settings must be a dictionary")
+            if key not in section:
+                raise ConfigValidationError(f"Missing required config key: {path}")
+            if required_type is not None and not isinstance(section[key], required_type):
+                raise ConfigValidationError(f"{path} must be a {_TYPE_NAMES[required_type]}")
 
         for cli_name, cli_config in config["cli_settings"].items():
             if not isinstance(cli_config, dict):
-                raise ConfigValidationError(
-                    f"cli_settings.{cli_name} must be a dictionary"
-                )
+                raise ConfigValidationError(f"cli_settings.{cli_name} must be a dictionary")
 
-            required_cli_keys = ["enabled", "timeout", "init_command", "prompt_pattern"]
-            for cli_key in required_cli_keys:
+            for cli_key in _CLI_KEYS:
                 if cli_key not in cli_config:
                     raise ConfigValidationError(
                         f"Missing required key in cli_settings.{cli_name}: {cli_key}"
                     )
 
-        # Validate context settings
-        if "max_tokens" not in config["context"]:
-            raise ConfigValidationError("Missing context.max_tokens")
-
-        if "compression_threshold" not in config["context"]:
-            raise ConfigValidationError("Missing context.compression_threshold")
-
-        # Validate session settings
-        if "auto_save" not in config["session"]:
-            raise ConfigValidationError("Missing session.auto_save")
-
     def get_cli_settings(self, cli_name: str) -> Dict[str, Any]:
         """
         Get settings for a specific CLI.
@@ -293,8 +438,11 @@ class ConfigManager:
         if mode not in valid_modes:
             raise ValueError(f"Invalid mode: {mode}. Must be one of {valid_modes}")
 
+        if self.config.get("default_mode") == mode:
+            return
+
         self.config["default_mode"] = mode
-        self.save_config()
+        self._changed()
 
     def update_cli_setting(self, cli_name: str, key: str, value: Any) -> None:
         """
@@ -311,8 +459,40 @@ class ConfigManager:
         if cli_name not in self.config["cli_settings"]:
             raise KeyError(f"CLI '{cli_name}' not found in configuration")
 
-        self.config["cli_settings"][cli_name][key] = value
-        self.save_config()
+        settings = self.config["cli_settings"][cli_name]
+        if key in settings and settings[key] == value:
+            return
+
+        settings[key] = value
+        self._changed()
+
+    @contextmanager
+    def transaction(self) -> Iterator["ConfigManager"]:
+        """
+        Group several updates into a single save.
+
+        Setters called inside the block only mark the config dirty; it is
+        written once when the outermost block exits normally, and not at
+        all if nothing changed.
+
+        Returns:
+            Iterator yielding this ConfigManager
+        """
+        self._txn_depth += 1
+        try:
+            yield self
+        finally:
+            self._txn_depth -= 1
+
+        if self._txn_depth == 0 and self._dirty:
+            self.save_config()
+
+    def _changed(self) -> None:
+        """Save a setter's change now, or defer it to the enclosing transaction."""
+        if self._txn_depth:
+            self._dirty = True
+        else:
+            self.save_config()
 
     def reload(self) -> None:
         """Reload configuration from file."""
@@ -1,14 +1,162 @@
 """Project context analysis and generation for AI CLIs."""
 
+import functools
+import io
 import json
+import os
+import re
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from .logging_config import get_logger
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # optional, see the "fast-json" extra
+    _json_loads = json.loads
+
 logger = get_logger(__name__)
 
 
+@functools.lru_cache(maxsize=1)
+def _get_token_encoding():
+    """
+    Get the tiktoken encoding used for token counts.
+
+    Returns:
+        tiktoken Encoding, or None if tiktoken is not installed or unusable
+    """
+    try:
+        import tiktoken
+
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        # ImportError, or the encoding could not be fetched/loaded
+        logger.debug(f"tiktoken unavailable, estimating tokens from length: {e}")
+        return None
+
+
+def estimate_tokens(text: str) -> int:
+    """Count tokens with tiktoken if installed, else estimate (~4 characters per token)."""
+    encoding = _get_token_encoding()
+    if encoding is None:
+        return len(text) // 4
+    return len(encoding.encode_ordinary(text))
+
+
+# Top-level files that mark each project type
+_PROJECT_TYPE_INDICATORS = {
+    "python": frozenset({"pyproject.toml", "setup.py", "requirements.txt", "Pipfile"}),
+    "javascript": frozenset({"package.json", "yarn.lock"}),
+    "typescript": frozenset({"tsconfig.json"}),
+    "rust": frozenset({"Cargo.toml"}),
+    "go": frozenset({"go.mod"}),
+}
+
+
+def _entry_names(path: Path) -> frozenset:
+    """Get the names in a directory with one scandir (empty if unreadable)."""
+    try:
+        with os.scandir(path) as entries:
+            return frozenset(entry.name for entry in entries)
+    except OSError:
+        return frozenset()
+
+
+def _subdirectories(path: Path) -> List[Path]:
+    """Get the subdirectories of a directory (empty if it is not one)."""
+    try:
+        with os.scandir(path) as entries:
+            return [Path(entry.path) for entry in entries if entry.is_dir()]
+    except OSError:
+        return []
+
+
+_json_decoder = json.JSONDecoder()
+_json_ws = re.compile(r"[ \t\n\r]*")
+
+
+def _scan_top_level(text: str, keys: frozenset) -> Optional[Dict[str, Any]]:
+    """
+    Decode top-level members of a JSON object from the start of a document.
+
+    Stops as soon as every key in keys has been seen, or the object closes.
+
+    Args:
+        text: Leading part of a JSON document, possibly cut off anywhere
+        keys: Top-level keys to collect
+
+    Returns:
+        Dict of the keys found, or None if text ran out (or is not a JSON
+        object) before that could be decided
+    """
+    wanted = set(keys)
+    found: Dict[str, Any] = {}
+    try:
+        idx = _json_ws.match(text, 0).end()
+        if text[idx] != "{":
+            return None
+        idx = _json_ws.match(text, idx + 1).end()
+        if text[idx] == "}":
+            return found
+
+        while wanted:
+            key, idx = _json_decoder.raw_decode(text, idx)
+            idx = _json_ws.match(text, idx).end()
+            if not isinstance(key, str) or text[idx] != ":":
+                return None
+            value, idx = _json_decoder.raw_decode(text, _json_ws.match(text, idx + 1).end())
+
+            # Only trust the value once the delimiter after it is in text: a
+            # number cut short at the end would otherwise decode fine
+            idx = _json_ws.match(text, idx).end()
+            delimiter = text[idx]
+            if key in wanted:
+                found[key] = value
+                wanted.discard(key)
+            if delimiter == "}":
+                break
+            if delimiter != ",":
+                return None
+            idx = _json_ws.match(text, idx + 1).end()
+    except (ValueError, IndexError):
+        return None
+
+    return found
+
+
+def _read_package_json(path: Path, keys: frozenset, head_bytes: int = 4096) -> Dict[str, Any]:
+    """
+    Read top-level keys from a package.json, parsing only its head if possible.
+
+    name, version and description normally come before the (possibly large)
+    dependency maps, so the first head_bytes usually hold all of them. The
+    whole file is read and parsed only when they do not.
+
+    Args:
+        path: Path to package.json
+        keys: Top-level keys of interest
+        head_bytes: How much of the file to try first
+
+    Returns:
+        Parsed JSON; may hold only the keys of interest
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If the file is not valid JSON
+    """
+    with open(path, "rb") as f:
+        head = f.read(head_bytes)
+        if len(head) < head_bytes:
+            return _json_loads(head)
+
+        found = _scan_top_level(head.decode("utf-8", "ignore"), keys)
+        if found is not None:
+            return found
+
+        return _json_loads(head + f.read())
+
+
 class ProjectStructure:
     """Represents analyzed project structure."""
 
@@ -36,15 +184,18 @@ class ContextBuilder:
     """
 
     # Mono-repo indicators
-    MONOREPO_FILES = [
-        "lerna.json",
-        "nx.json",
-        "pnpm-workspace.yaml",
-        "turbo.json",
-        "rush.json",
-    ]
+    MONOREPO_FILES = frozenset(
+        {
+            "lerna.json",
+            "nx.json",
+            "pnpm-workspace.yaml",
+            "turbo.json",
+            "rush.json",
+        }
+    )
 
-    MONOREPO_DIRS = ["services", "packages", "apps", "libs"]
+    # A tuple rather than a set: it fixes the order services are listed in
+    MONOREPO_DIRS = ("services", "packages", "apps", "libs")
 
     def __init__(self, project_path: Path, config: Optional[Dict[str, Any]] = None):
         """
@@ -57,6 +208,9 @@ class ContextBuilder:
         self.project_path = Path(project_path)
         self.config = config or {}
         self.structure: Optional[ProjectStructure] = None
+        self._structure_sig: Optional[Tuple[int, Optional[int]]] = None
+        self._toplevel: Optional[frozenset] = None  # see _toplevel_names
+        self._codex_md: Dict[Optional[str], str] = {}  # see generate_codex_md
 
         # Get context settings from config
         context_config = self.config.get("context", {})
@@ -75,8 +229,17 @@ class ContextBuilder:
         - Project type (Python, JavaScript, mixed, etc.)
         - Services/components in mono-repos
         - Key directories and files
+
+        The result is reused while the project directory and its
+        package.json keep the same modification times.
         """
+        sig = self._analysis_signature()
+        if self.structure is not None and sig is not None and sig == self._structure_sig:
+            return self.structure
+
         logger.info(f"Analyzing project at {self.project_path}")
+        self._toplevel = None
+        self._codex_md.clear()
 
         # Detect mono-repo
         is_monorepo = self._detect_monorepo()
@@ -99,6 +262,7 @@ class ContextBuilder:
             services=services,
             metadata=metadata,
         )
+        self._structure_sig = sig
 
         logger.info(
             f"Project analysis complete: {'mono-repo' if is_monorepo else 'single repo'}, "
@@ -107,6 +271,40 @@ class ContextBuilder:
 
         return self.structure
 
+    def _analysis_signature(self) -> Optional[Tuple[int, Optional[int]]]:
+        """
+        Get the modification times that invalidate a previous analysis.
+
+        The directory mtime changes when top-level entries are added or
+        removed; package.json is read for metadata, so its edits count too.
+
+        Returns:
+            (project dir mtime_ns, package.json mtime_ns or None), or None if
+            the project directory cannot be stat'ed
+        """
+        try:
+            dir_mtime = os.stat(self.project_path).st_mtime_ns
+        except OSError:
+            return None
+
+        try:
+            package_mtime = os.stat(self.project_path / "package.json").st_mtime_ns
+        except OSError:
+            package_mtime = None
+
+        return dir_mtime, package_mtime
+
+    def _toplevel_names(self) -> frozenset:
+        """
+        Get the names in the project root, read once per analysis.
+
+        Returns:
+            Frozenset of top-level file and directory names
+        """
+        if self._toplevel is None:
+            self._toplevel = _entry_names(self.project_path)
+        return self._toplevel
+
     def _detect_monorepo(self) -> bool:
         """
         Detect if project is a mono-repo.
@@ -114,31 +312,33 @@ class ContextBuilder:
         Returns:
             True if mono-repo detected
         """
+        names = self._toplevel_names()
+
         # Check for mono-repo config files
-        for filename in self.MONOREPO_FILES:
-            if (self.project_path / filename).exists():
-                logger.debug(f"Mono-repo detected: found {filename}")
-                return True
+        found = self.MONOREPO_FILES & names
+        if found:
+            logger.debug(f"Mono-repo detected: found {', '.join(sorted(found))}")
+            return True
 
         # Check for mono-repo directory structure
         for dirname in self.MONOREPO_DIRS:
-            dir_path = self.project_path / dirname
-            if dir_path.exists() and dir_path.is_dir():
-                # Check if it contains multiple sub-projects
-                subdirs = [d for d in dir_path.iterdir() if d.is_dir()]
-                if len(subdirs) >= 2:
-                    # Check if subdirs have their own package.json/pyproject.toml
-                    has_projects = sum(
-                        1
-                        for d in subdirs
-                        if (d / "package.json").exists()
-                        or (d / "pyproject.toml").exists()
+            if dirname not in names:
+                continue
+
+            # Check if it contains multiple sub-projects
+            subdirs = _subdirectories(self.project_path / dirname)
+            if len(subdirs) >= 2:
+                # Check if subdirs have their own package.json/pyproject.toml
+                has_projects = sum(
+                    1
+                    for d in subdirs
+                    if not _entry_names(d).isdisjoint(("package.json", "pyproject.toml"))
+                )
+                if has_projects >= 2:
+                    logger.debug(
+                        f"Mono-repo detected: {dirname}/ has {has_projects} sub-projects"
                     )
-                    if has_projects >= 2:
-                        logger.debug(
-                            f"Mono-repo detected: {dirname}/ has {has_projects} sub-projects"
-                        )
-                        return True
+                    return True
 
         return False
 
@@ -149,18 +349,12 @@ class ContextBuilder:
         Returns:
             Project type string (e.g., 'python', 'javascript', 'typescript', 'mixed')
         """
-        indicators = {
-            "python": ["pyproject.toml", "setup.py", "requirements.txt", "Pipfile"],
-            "javascript": ["package.json", "yarn.lock"],
-            "typescript": ["tsconfig.json"],
-            "rust": ["Cargo.toml"],
-            "go": ["go.mod"],
-        }
-
-        detected = []
-        for proj_type, files in indicators.items():
-            if any((self.project_path / f).exists() for f in files):
-                detected.append(proj_type)
+        names = self._toplevel_names()
+        detected = [
+            proj_type
+            for proj_type, files in _PROJECT_TYPE_INDICATORS.items()
+            if not files.isdisjoint(names)
+        ]
 
         if not detected:
             return "unknown"
@@ -180,15 +374,13 @@ class ContextBuilder:
         """
         services = []
 
+        names = self._toplevel_names()
+
         for dirname in self.MONOREPO_DIRS:
-            dir_path = self.project_path / dirname
-            if not dir_path.exists():
+            if dirname not in names:
                 continue
 
-            for service_dir in dir_path.iterdir():
-                if not service_dir.is_dir():
-                    continue
-
+            for service_dir in _subdirectories(self.project_path / dirname):
                 # Check if it's a valid service
                 service_info = self._analyze_service(service_dir)
                 if service_info:
@@ -207,8 +399,9 @@ class ContextBuilder:
             Service info dict or None if not a valid service
         """
         # Check for package indicators
-        has_package_json = (service_path / "package.json").exists()
-        has_pyproject = (service_path / "pyproject.toml").exists()
+        names = _entry_names(service_path)
+        has_package_json = "package.json" in names
+        has_pyproject = "pyproject.toml" in names
 
         if not (has_package_json or has_pyproject):
             return None
@@ -216,7 +409,7 @@ class ContextBuilder:
         # Determine service type
         if has_pyproject:
             service_type = "python"
-        elif (service_path / "tsconfig.json").exists():
+        elif "tsconfig.json" in names:
             service_type = "typescript"
         elif has_package_json:
             service_type = "javascript"
@@ -230,9 +423,8 @@ class ContextBuilder:
         description = ""
         if has_package_json:
             try:
-                with open(service_path / "package.json") as f:
-                    pkg = json.load(f)
-                    description = pkg.get("description", "")
+                pkg = _read_package_json(service_path / "package.json", frozenset({"description"}))
+                description = pkg.get("description", "")
             except:
                 pass
 
@@ -250,19 +442,21 @@ class ContextBuilder:
         Returns:
             Metadata dictionary
         """
+        names = self._toplevel_names()
         metadata = {
             "name": self.project_path.name,
-            "has_git": (self.project_path / ".git").exists(),
-            "has_readme": (self.project_path / "README.md").exists(),
+            "has_git": ".git" in names,
+            "has_readme": "README.md" in names,
         }
 
         # Try to get project name from package.json or pyproject.toml
-        if (self.project_path / "package.json").exists():
+        if "package.json" in names:
             try:
-                with open(self.project_path / "package.json") as f:
-                    pkg = json.load(f)
-                    metadata["name"] = pkg.get("name", metadata["name"])
-                    metadata["version"] = pkg.get("version")
+                pkg = _read_package_json(
+                    self.project_path / "package.json", frozenset({"name", "version"})
+                )
+                metadata["name"] = pkg.get("name", metadata["name"])
+                metadata["version"] = pkg.get("version")
             except:
                 pass
 
@@ -281,42 +475,35 @@ class ContextBuilder:
         if not self.structure:
             self.analyze_project()
 
-        lines = [
-            "# Project Context for Claude Code",
-            "",
-            f"**Project:** {self.structure.metadata['name']}",
-            f"**Type:** {self.structure.project_type}",
-            f"**Structure:** {'Mono-repository' if self.structure.is_monorepo else 'Single repository'}",
-            "",
-        ]
+        # Every line is written with its newline; this matches joining the
+        # lines with a trailing "" entry
+        buf = io.StringIO()
+        w = buf.write
+        w("# Project Context for Claude Code\n\n")
+        w(f"**Project:** {self.structure.metadata['name']}\n")
+        w(f"**Type:** {self.structure.project_type}\n")
+        structure = "Mono-repository" if self.structure.is_monorepo else "Single repository"
+        w(f"**Structure:** {structure}\n\n")
 
         if self.structure.is_monorepo:
-            lines.extend(["## Services/Components", ""])
+            w("## Services/Components\n\n")
             for service in self.structure.services:
-                lines.append(f"### {service['name']}")
-                lines.append(f"- **Path:** `{service['path']}`")
-                lines.append(f"- **Type:** {service['type']}")
+                w(f"### {service['name']}\n")
+                w(f"- **Path:** `{service['path']}`\n")
+                w(f"- **Type:** {service['type']}\n")
                 if service.get("description"):
-                    lines.append(f"- **Description:** {service['description']}")
-                lines.append("")
+                    w(f"- **Description:** {service['description']}\n")
+                w("\n")
 
             if focus_service:
-                lines.extend(
-                    [f"## Current Focus: {focus_service}", "", "Work on this service only.", ""]
-                )
+                w(f"## Current Focus: {focus_service}\n\nWork on this service only.\n\n")
 
-        lines.extend(
-            [
-                "## Guidelines",
-                "",
-                "- Follow existing code style and conventions",
-                "- Update tests when modifying functionality",
-                "- Keep changes focused and atomic",
-                "",
-            ]
-        )
+        w("## Guidelines\n\n")
+        w("- Follow existing code style and conventions\n")
+        w("- Update tests when modifying functionality\n")
+        w("- Keep changes focused and atomic\n")
 
-        return "\n".join(lines)
+        return buf.getvalue()
 
     def generate_codex_md(self, focus_service: Optional[str] = None) -> str:
         """
@@ -327,27 +514,31 @@ class ContextBuilder:
 
         Returns:
             Markdown content for CODEX.md
+
+        The content is cached per focus_service until the project is
+        re-analyzed, so GEMINI.md reuses it instead of rebuilding it.
         """
         if not self.structure:
             self.analyze_project()
 
-        lines = [
-            "# Project Context for Codex",
-            "",
-            f"Project: {self.structure.metadata['name']}",
-            f"Type: {self.structure.project_type}",
-            "",
-        ]
+        cached = self._codex_md.get(focus_service)
+        if cached is not None:
+            return cached
+
+        buf = io.StringIO()
+        w = buf.write
+        w("# Project Context for Codex\n\n")
+        w(f"Project: {self.structure.metadata['name']}\n")
+        w(f"Type: {self.structure.project_type}\n")
 
         if self.structure.is_monorepo:
-            lines.append("## Services")
-            lines.append("")
+            w("\n## Services\n\n")
             for service in self.structure.services:
-                lines.append(f"- **{service['name']}** ({service['type']}): {service['path']}")
+                w(f"- **{service['name']}** ({service['type']}): {service['path']}\n")
 
-            lines.append("")
-
-        return "\n".join(lines)
+        content = buf.getvalue()
+        self._codex_md[focus_service] = content
+        return content
 
     def generate_gemini_md(self, focus_service: Optional[str] = None) -> str:
         """
@@ -392,15 +583,16 @@ class ContextBuilder:
                 content = msg.get("content", "")
                 parts.append(f"**{role}:** {content}\n")
 
-        # Combine
-        context = "\n".join(parts)
+        # Combine (nothing to join without history)
+        context = "\n".join(parts) if len(parts) > 1 else overview
+        context_len = len(context)
 
         # Trim/compress if needed
         token_count = self._estimate_tokens(context)
         if token_count > self.max_tokens:
-            context = self._trim_context(context, self.max_tokens)
+            context = self._trim_context(context, self.max_tokens, context_len)
         elif token_count > self.compression_threshold:
-            context = self._compress_context(context)
+            context = self._compress_context(context, context_len)
 
         return context
 
@@ -412,23 +604,35 @@ class ContextBuilder:
             text: Text to estimate
 
         Returns:
-            Estimated token count (rough approximation: 1 token ≈ 4 chars)
+            Token count from tiktoken if installed, else ~4 characters per token
         """
-        return len(text) // 4
+        return estimate_tokens(text)
 
-    def _trim_context(self, context: str, max_tokens: int) -> str:
+    def _trim_context(
+        self, context: str, max_tokens: int, context_len: Optional[int] = None
+    ) -> str:
         """
         Trim context to fit within token limit.
 
+        With tiktoken the cut is made on token boundaries, so text denser
+        than ~4 characters per token (code, CJK, base64) is trimmed too.
+
         Args:
             context: Context string
             max_tokens: Maximum allowed tokens
+            context_len: len(context), if the caller already has it
 
         Returns:
             Trimmed context
         """
+        encoding = _get_token_encoding()
+        if encoding is not None:
+            return self._trim_context_tokens(context, max_tokens, encoding)
+
+        if context_len is None:
+            context_len = len(context)
         max_chars = max_tokens * 4
-        if len(context) <= max_chars:
+        if context_len <= max_chars:
             return context
 
         # Trim from middle, keeping start and end
@@ -437,38 +641,69 @@ class ContextBuilder:
 
         trimmed = (
             context[:keep_start]
-            + f"\n\n[... {len(context) - max_chars} characters trimmed ...]\n\n"
+            + f"\n\n[... {context_len - max_chars} characters trimmed ...]\n\n"
             + context[-keep_end:]
         )
 
-        logger.debug(f"Context trimmed from {len(context)} to {len(trimmed)} chars")
+        logger.debug(f"Context trimmed from {context_len} to {len(trimmed)} chars")
+        return trimmed
+
+    def _trim_context_tokens(self, context: str, max_tokens: int, encoding) -> str:
+        """
+        Trim context from the middle on token boundaries.
+
+        Args:
+            context: Context string
+            max_tokens: Maximum allowed tokens
+            encoding: tiktoken Encoding to count with
+
+        Returns:
+            Trimmed context, including the marker, within max_tokens
+        """
+        tokens = encoding.encode_ordinary(context)
+        if len(tokens) <= max_tokens:
+            return context
+
+        # Reserve room for the marker (sized for the largest possible count)
+        marker = "\n\n[... {} tokens trimmed ...]\n\n"
+        budget = max(max_tokens - len(encoding.encode_ordinary(marker.format(len(tokens)))), 0)
+        keep_start = budget // 2
+        keep_end = budget - keep_start
+
+        trimmed = (
+            encoding.decode(tokens[:keep_start])
+            + marker.format(len(tokens) - budget)
+            + (encoding.decode(tokens[-keep_end:]) if keep_end else "")
+        )
+
+        logger.debug(f"Context trimmed from {len(tokens)} to ~{max_tokens} tokens")
         return trimmed
 
-    def _compress_context(self, context: str) -> str:
+    def _compress_context(self, context: str, context_len: Optional[int] = None) -> str:
         """
         Compress context by removing redundancy.
 
         Args:
             context: Context string
+            context_len: len(context), if the caller already has it
 
         Returns:
             Compressed context
         """
-        # Simple compression: remove extra whitespace, deduplicate lines
-        lines = context.split("\n")
-
-        # Remove empty lines
-        lines = [line.strip() for line in lines if line.strip()]
+        if context_len is None:
+            context_len = len(context)
 
-        # Remove duplicate consecutive lines
+        # Simple compression in one pass: strip whitespace, drop empty lines
+        # and lines repeating the previous non-empty one
         compressed_lines = []
         prev_line = None
-        for line in lines:
-            if line != prev_line:
+        for line in context.split("\n"):
+            line = line.strip()
+            if line and line != prev_line:
                 compressed_lines.append(line)
-            prev_line = line
+                prev_line = line
 
         compressed = "\n".join(compressed_lines)
 
-        logger.debug(f"Context compressed from {len(context)} to {len(compressed)} chars")
+        logger.debug(f"Context compressed from {context_len} to {len(compressed)} chars")
         return compressed
@@ -1,16 +1,29 @@
 """Logging configuration with Rich handler support."""
 
+import atexit
 import logging
+import queue
 import sys
+import threading
 from pathlib import Path
 from typing import Optional
 
 from rich.console import Console
-from rich.logging import RichHandler
-from rich.traceback import install
 
-# Install rich traceback handler
-install(show_locals=True, max_frames=10)
+# Log level names accepted by setup() and set_level(), including the
+# WARN and FATAL aliases the logging module also defines
+_LEVELS = {
+    name: getattr(logging, name)
+    for name in ("DEBUG", "INFO", "WARNING", "WARN", "ERROR", "CRITICAL", "FATAL")
+}
+
+# Formatters are stateless, so one instance of each serves every handler
+_RICH_FORMATTER = logging.Formatter("%(message)s", datefmt="[%X]")
+_PLAIN_FORMATTER = logging.Formatter("[%(asctime)s] %(levelname)-8s %(message)s", datefmt="%X")
+_FILE_FORMATTER = logging.Formatter(
+    "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
 
 
 class LoggingConfig:
@@ -18,15 +31,17 @@ class LoggingConfig:
     Centralized logging configuration for AI Roundtable.
 
     Features:
-    - Rich console formatting with colors and tracebacks
-    - File logging with rotation
+    - Rich console formatting with colors and tracebacks (on a terminal)
+    - File logging with rotation, written from a background thread
     - Configurable log levels
     - Module-specific logger configuration
     """
 
     _initialized = False
+    _lock = threading.Lock()  # serializes setup(); _initialized is the fast path
     _log_dir: Optional[Path] = None
     _console: Optional[Console] = None
+    _listener = None  # QueueListener feeding the file handler
 
     @classmethod
     def setup(
@@ -44,66 +59,101 @@ class LoggingConfig:
             log_dir: Directory for log files (defaults to ~/.ai-roundtable/logs)
             console: Rich console instance (creates new if None)
             enable_file_logging: Whether to enable file logging
+
+        Rich handlers and tracebacks are only loaded when stderr is a
+        terminal; otherwise console output goes through a plain
+        StreamHandler. Locals are shown in tracebacks at DEBUG level only.
+        Safe to call from several threads: only the first call configures.
         """
         if cls._initialized:
             return
 
-        # Set up log directory
-        if log_dir is None:
-            log_dir = Path.home() / ".ai-roundtable" / "logs"
-
-        cls._log_dir = log_dir
-        cls._log_dir.mkdir(parents=True, exist_ok=True)
-
-        # Set up console
-        if console is None:
-            console = Console(stderr=True)
-        cls._console = console
-
-        # Configure root logger
-        root_logger = logging.getLogger()
-        root_logger.setLevel(getattr(logging, log_level.upper()))
-
-        # Remove existing handlers
-        root_logger.handlers.clear()
-
-        # Add Rich console handler
-        console_handler = RichHandler(
-            console=console,
-            show_time=True,
-            show_path=True,
-            rich_tracebacks=True,
-            tracebacks_show_locals=True,
-            markup=True,
-        )
-        console_handler.setLevel(getattr(logging, log_level.upper()))
-        console_handler.setFormatter(
-            logging.Formatter(
-                "%(message)s",
-                datefmt="[%X]",
-            )
-        )
-        root_logger.addHandler(console_handler)
-
-        # Add file handler if enabled
-        if enable_file_logging:
-            file_handler = cls._create_file_handler(log_level)
-            root_logger.addHandler(file_handler)
+        with cls._lock:
+            # Another thread may have finished setup while we waited
+            if cls._initialized:
+                return
+
+            # Set up log directory
+            if log_dir is None:
+                log_dir = Path.home() / ".ai-roundtable" / "logs"
+
+            cls._log_dir = log_dir
+            cls._log_dir.mkdir(parents=True, exist_ok=True)
+
+            level = _LEVELS[log_level.upper()]
+
+            # Configure root logger
+            root_logger = logging.getLogger()
+            root_logger.setLevel(level)
+
+            # Remove existing handlers
+            root_logger.handlers.clear()
+
+            if sys.stderr.isatty():
+                from rich.logging import RichHandler
+                from rich.traceback import install
+
+                show_locals = level == logging.DEBUG
+
+                # Install rich traceback handler
+                install(show_locals=show_locals, max_frames=10)
+
+                # Set up console
+                if console is None:
+                    console = Console(stderr=True)
+
+                # Add Rich console handler
+                console_handler = RichHandler(
+                    console=console,
+                    show_time=True,
+                    show_path=True,
+                    rich_tracebacks=True,
+                    tracebacks_show_locals=show_locals,
+                    markup=True,
+                )
+                console_handler.setFormatter(_RICH_FORMATTER)
+            else:
+                # Plain handler for pipes, files and CI logs
+                console_handler = logging.StreamHandler(sys.stderr)
+                console_handler.setFormatter(_PLAIN_FORMATTER)
+            cls._console = console
+
+            console_handler.setLevel(level)
+            root_logger.addHandler(console_handler)
+
+            # Add file handler if enabled. Records are only queued on the
+            # logging thread; a listener thread does the formatting and disk I/O
+            if enable_file_logging:
+                from logging.handlers import QueueHandler, QueueListener
+
+                file_handler = cls._create_file_handler(level)
+                log_queue = queue.SimpleQueue()
+                queue_handler = QueueHandler(log_queue)
+                queue_handler.setLevel(level)
+                root_logger.addHandler(queue_handler)
+
+                cls._listener = QueueListener(
+                    log_queue, file_handler, respect_handler_level=True
+                )
+                cls._listener.start()
+                # Flushes queued records before the interpreter exits
+                atexit.register(cls._listener.stop)
+
+            # Configure third-party loggers to reduce noise
+            logging.getLogger("urllib3").setLevel(logging.WARNING)
+            logging.getLogger("pexpect").setLevel(logging.WARNING)
+
+            cls._initialized = True
 
-        # Configure third-party loggers to reduce noise
-        logging.getLogger("urllib3").setLevel(logging.WARNING)
-        logging.getLogger("pexpect").setLevel(logging.WARNING)
-
-        cls._initialized = True
         root_logger.info("Logging configured successfully")
 
     @classmethod
-    def _create_file_handler(cls, log_level: str) -> logging.FileHandler:
+    def _create_file_handler(cls, level: int) -> logging.FileHandler:
         """
         Create a file handler with rotation.
 
         Args:
-            log_level: Logging level
+            level: Numeric logging level
 
         Returns:
             Configured file handler
@@ -117,13 +167,8 @@ class LoggingConfig:
             maxBytes=10 * 1024 * 1024,  # 10MB
             backupCount=5,
         )
-        file_handler.setLevel(getattr(logging, log_level.upper()))
-        file_handler.setFormatter(
-            logging.Formatter(
-                "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-                datefmt="%Y-%m-%d %H:%M:%S",
-            )
-        )
+        file_handler.setLevel(level)
+        file_handler.setFormatter(_FILE_FORMATTER)
 
         return file_handler
 
@@ -151,7 +196,7 @@ class LoggingConfig:
         Args:
             log_level: New logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         """
-        level = getattr(logging, log_level.upper())
+        level = _LEVELS[log_level.upper()]
 
         root_logger = logging.getLogger()
         root_logger.setLevel(level)
@@ -159,6 +204,11 @@ class LoggingConfig:
         for handler in root_logger.handlers:
             handler.setLevel(level)
 
+        # Handlers fed through the queue are not attached to the root logger
+        if cls._listener is not None:
+            for handler in cls._listener.handlers:
+                handler.setLevel(level)
+
     @classmethod
     def get_log_dir(cls) -> Optional[Path]:
         """Get the log directory path."""
@@ -1,6 +1,8 @@
 """Core orchestration engine for AI Roundtable."""
 
 import json
+import os
+import queue
 import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -8,7 +10,8 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple
 
 from .cli_managers import (
     AICliManager,
@@ -23,9 +26,29 @@ from .config import ConfigManager
 from .context import ContextBuilder
 from .logging_config import get_logger
 
+try:
+    import orjson
+except ImportError:  # optional, see the "fast-json" extra
+    orjson = None
+
 logger = get_logger(__name__)
 
 
+def _dump_json(data: Any) -> bytes:
+    """Serialize session state as compact JSON, using orjson when installed."""
+    if orjson is not None:
+        # Non-string keys become strings, as with the json module
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+def _load_json(raw: bytes) -> Any:
+    """Parse session state written by _dump_json."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 class OrchestratorState(Enum):
     """Orchestrator state enumeration."""
 
@@ -44,7 +67,7 @@ class DiscussionMode(Enum):
     REVIEW = "review"
 
 
-@dataclass
+@dataclass(slots=True)
 class DiscussionResponse:
     """Response from an AI CLI during discussion."""
 
@@ -54,8 +77,18 @@ class DiscussionResponse:
     error: Optional[str] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the dict stored in conversation history."""
+        return {
+            "cli_name": self.cli_name,
+            "response": self.response,
+            "timestamp": self.timestamp.isoformat(),
+            "error": self.error,
+            "metadata": self.metadata,
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class SessionState:
     """Persistent session state."""
 
@@ -102,6 +135,9 @@ class MonoRepoOrchestrator:
         "gemini": GeminiManager,
     }
 
+    # Default order of sequential discussions
+    SEQUENTIAL_ORDER = ("claude_code", "codex", "gemini")
+
     def __init__(
         self,
         project_path: Path,
@@ -120,8 +156,15 @@ class MonoRepoOrchestrator:
         self.config = config or ConfigManager()
         self.context_builder = ContextBuilder(self.project_path, self.config.config)
 
-        # CLI managers
-        self.ai_managers: Dict[str, AICliManager] = {}
+        # CLI managers. Published as a read-only mapping that is replaced,
+        # never mutated, so readers can use it without the lock; take one
+        # reference per operation to see a consistent set
+        self.ai_managers: Mapping[str, AICliManager] = MappingProxyType({})
+
+        # Enabled CLIs with their settings, and why the others are left out
+        self._cli_plan: List[Tuple[str, type, Dict[str, Any]]] = []
+        self._cli_skipped: Dict[str, Optional[str]] = {}
+        self._build_cli_plan()
 
         # State management
         self.state = OrchestratorState.STOPPED
@@ -138,10 +181,32 @@ class MonoRepoOrchestrator:
         # Thread safety
         self._lock = threading.Lock()
 
+        # Worker threads for CLI probes and parallel discussions, kept across
+        # calls (see _get_executor) and shut down by stop_all_clis
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        # Set once stop_all_clis has begun, so the signal handler, the
+        # interactive loop and atexit cleanup stop the CLIs only once;
+        # _stop_done is set when that stop has finished, for later callers
+        # to wait on
+        self._stopped = threading.Event()
+        self._stop_done = threading.Event()
+        self._stopping_thread: Optional[int] = None
+
         # Session directory
         self.session_dir = Path.home() / ".ai-roundtable" / "sessions" / self.session_id
         self.session_dir.mkdir(parents=True, exist_ok=True)
 
+        # Discussions are appended here one JSON line each; state.json only
+        # holds the small session header
+        self._history_file = self.session_dir / "history.jsonl"
+
+        # state.json is written by a background thread (see _save_worker),
+        # started on the first save and joined by stop_all_clis
+        self._save_queue: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue(maxsize=16)
+        self._save_thread: Optional[threading.Thread] = None
+        self._save_thread_lock = threading.Lock()
+
     def _generate_session_id(self) -> str:
         """Generate unique session ID."""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -159,97 +224,201 @@ class MonoRepoOrchestrator:
         Raises:
             PartialStartupError: If some CLIs fail to start
         """
+        # Claim the startup under the lock, then probe without holding it
         with self._lock:
             if self.state == OrchestratorState.RUNNING:
                 logger.warning("Orchestrator already running")
                 return {name: True for name in self.ai_managers.keys()}
 
-            try:
-                self.state = OrchestratorState.STARTING
-                logger.debug(f"Initializing AI Roundtable for {self.project_path}")
-
-                # Analyze project structure (for internal use, not for generating files)
-                logger.debug("Analyzing project structure...")
-                self.context_builder.analyze_project()
+        if not self._try_transition(
+            (OrchestratorState.STOPPED, OrchestratorState.PAUSED, OrchestratorState.ERROR),
+            OrchestratorState.STARTING,
+        ):
+            raise OrchestratorError(f"Cannot start orchestrator while {self.state.value}")
 
-                # Initialize each CLI manager (verifies CLI availability)
-                results = {}
-                successful = []
-                failed = {}
+        try:
+            self._stopped.clear()
+            logger.debug(f"Initializing AI Roundtable for {self.project_path}")
+
+            # Analyze project structure (for internal use, not for generating files)
+            logger.debug("Analyzing project structure...")
+            self.context_builder.analyze_project()
+
+            # Initialize each CLI manager (verifies CLI availability).
+            # Probes are I/O-bound subprocess runs, so check all CLIs at once.
+            results = {}
+            successful = []
+            failed = {}
+            managers = {}
+
+            executor = self._get_executor()
+            futures = {
+                cli_name: executor.submit(self._probe_cli, cli_name, manager_class, cli_config)
+                for cli_name, manager_class, cli_config in self._cli_plan
+            }
 
-                for cli_name, manager_class in self.CLI_MANAGERS.items():
-                    try:
-                        # Get CLI-specific configuration
-                        cli_config = self.config.get_cli_settings(cli_name)
-
-                        # Check if CLI is enabled
-                        if not cli_config.get("enabled", True):
-                            logger.info(f"Skipping {cli_name} (disabled in config)")
-                            results[cli_name] = False
-                            continue
-
-                        # Create and verify manager (non-interactive mode)
-                        logger.debug(f"Checking {cli_name}...")
-                        manager = manager_class(
-                            cli_name=cli_name,
-                            config=cli_config,
-                            project_path=self.project_path,
-                        )
-
-                        success = manager.start()
-                        results[cli_name] = success
-
-                        if success:
-                            self.ai_managers[cli_name] = manager
-                            successful.append(cli_name)
-                            logger.debug(f"✓ {cli_name} available")
-                        else:
-                            failed[cli_name] = "Not available"
-                            logger.error(f"✗ {cli_name} not available")
-
-                    except KeyError:
-                        # CLI not configured
-                        logger.warning(f"CLI '{cli_name}' not found in configuration, skipping")
-                        results[cli_name] = False
-                        failed[cli_name] = "Not configured"
-
-                    except (AICliProcessError, AICliTimeoutError) as e:
-                        logger.error(f"Error checking {cli_name}: {e}")
-                        results[cli_name] = False
-                        failed[cli_name] = str(e)
-
-                    except Exception as e:
-                        logger.error(f"Unexpected error checking {cli_name}: {e}")
-                        results[cli_name] = False
-                        failed[cli_name] = f"Unexpected error: {e}"
-
-                # Update state
-                if successful:
+            # Merge in CLI_MANAGERS order so active_clis stays deterministic
+            for cli_name in self.CLI_MANAGERS:
+                if cli_name in futures:
+                    manager, error = futures[cli_name].result()
+                else:
+                    manager, error = None, self._cli_skipped.get(cli_name)
+                results[cli_name] = manager is not None
+
+                if manager is not None:
+                    managers[cli_name] = manager
+                    successful.append(cli_name)
+                elif error is not None:
+                    failed[cli_name] = error
+
+            if not successful:
+                logger.error("No CLIs available")
+                raise OrchestratorError("All enabled CLIs are unavailable")
+
+            # Publish the managers and go live in one step; a stop_all_clis
+            # that ran meanwhile has already moved the state off STARTING
+            with self._lock:
+                if self.state != OrchestratorState.STARTING:
+                    started = False
+                else:
+                    started = True
+                    self.ai_managers = MappingProxyType(managers)
                     self.state = OrchestratorState.RUNNING
                     self.session_state.active_clis = successful
                     self.session_state.state = self.state
-                    self._save_session_state()
-
-                    if failed:
-                        logger.warning(
-                            f"Orchestrator ready with {len(successful)}/{len(self.CLI_MANAGERS)} CLIs "
-                            f"({len(failed)} unavailable: {', '.join(failed.keys())})"
-                        )
-                    else:
-                        logger.info(
-                            f"Orchestrator ready with {len(successful)}/{len(self.CLI_MANAGERS)} CLIs"
-                        )
-                else:
-                    self.state = OrchestratorState.ERROR
-                    logger.error("No CLIs available")
-                    raise OrchestratorError("All enabled CLIs are unavailable")
 
-                return results
+            if not started:
+                for manager in managers.values():
+                    manager.stop()
+                raise OrchestratorError("Orchestrator was stopped during startup")
 
-            except Exception as e:
-                self.state = OrchestratorState.ERROR
-                logger.error(f"Failed to start orchestrator: {e}")
-                raise OrchestratorError(f"Orchestrator startup failed: {e}")
+            self._save_session_state()
+
+            if failed:
+                logger.warning(
+                    f"Orchestrator ready with {len(successful)}/{len(self.CLI_MANAGERS)} CLIs "
+                    f"({len(failed)} unavailable: {', '.join(failed.keys())})"
+                )
+            else:
+                logger.info(
+                    f"Orchestrator ready with {len(successful)}/{len(self.CLI_MANAGERS)} CLIs"
+                )
+
+            return results
+
+        except Exception as e:
+            self._try_transition((OrchestratorState.STARTING,), OrchestratorState.ERROR)
+            logger.error(f"Failed to start orchestrator: {e}")
+            raise OrchestratorError(f"Orchestrator startup failed: {e}")
+
+    def _try_transition(
+        self, expected: Tuple[OrchestratorState, ...], new: OrchestratorState
+    ) -> bool:
+        """
+        Move to a new state if the current one is among expected.
+
+        Only the check and the write happen under the lock, so callers can
+        claim a transition and then do slow work (starting or stopping
+        CLIs) without blocking other threads.
+
+        Args:
+            expected: States the transition is allowed from
+            new: State to move to
+
+        Returns:
+            True if the state was changed
+        """
+        with self._lock:
+            if self.state not in expected:
+                return False
+            self.state = new
+            return True
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """
+        Get the worker pool, creating it on first use after init or a stop.
+
+        Sized to CLI_MANAGERS so every CLI can be queried at once.
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=len(self.CLI_MANAGERS), thread_name_prefix="ai-rt"
+                )
+            return self._executor
+
+    def _build_cli_plan(self) -> None:
+        """
+        Resolve which CLIs to start, and their settings, from the config.
+
+        Done once per config load rather than on every start_all_clis.
+        """
+        plan = []
+        skipped = {}
+
+        for cli_name, manager_class in self.CLI_MANAGERS.items():
+            try:
+                # Get CLI-specific configuration
+                cli_config = self.config.get_cli_settings(cli_name)
+            except KeyError:
+                # CLI not configured
+                logger.warning(f"CLI '{cli_name}' not found in configuration, skipping")
+                skipped[cli_name] = "Not configured"
+                continue
+
+            # Check if CLI is enabled
+            if not cli_config.get("enabled", True):
+                logger.info(f"Skipping {cli_name} (disabled in config)")
+                skipped[cli_name] = None
+                continue
+
+            plan.append((cli_name, manager_class, cli_config))
+
+        self._cli_plan = plan
+        self._cli_skipped = skipped
+
+    def reload_config(self) -> None:
+        """Re-read the config file and re-resolve the CLIs used by the next start."""
+        self.config.reload()
+        self._build_cli_plan()
+
+    def _probe_cli(
+        self, cli_name: str, manager_class: type, cli_config: Dict[str, Any]
+    ) -> Tuple[Optional[AICliManager], Optional[str]]:
+        """
+        Create and verify a single CLI manager.
+
+        Args:
+            cli_name: Name of the CLI
+            manager_class: AICliManager subclass to instantiate
+            cli_config: The CLI's settings from config
+
+        Returns:
+            (manager, None) if available, or (None, error) if unavailable
+        """
+        try:
+            # Create and verify manager (non-interactive mode)
+            logger.debug(f"Checking {cli_name}...")
+            manager = manager_class(
+                cli_name=cli_name,
+                config=cli_config,
+                project_path=self.project_path,
+            )
+
+            if manager.start():
+                logger.debug(f"✓ {cli_name} available")
+                return manager, None
+
+            logger.error(f"✗ {cli_name} not available")
+            return None, "Not available"
+
+        except (AICliProcessError, AICliTimeoutError) as e:
+            logger.error(f"Error checking {cli_name}: {e}")
+            return None, str(e)
+
+        except Exception as e:
+            logger.error(f"Unexpected error checking {cli_name}: {e}")
+            return None, f"Unexpected error: {e}"
 
     def sequential_discussion(
         self, question: str, cli_order: Optional[List[str]] = None
@@ -257,7 +426,9 @@ class MonoRepoOrchestrator:
         """
         Run sequential discussion mode.
 
-        Each AI receives the question plus all previous responses.
+        Each AI receives the question plus all previous responses, so every
+        step depends on the one before it and the CLIs cannot be overlapped.
+        Use parallel_discussion for independent answers to the same question.
 
         Args:
             question: Question to ask
@@ -266,67 +437,114 @@ class MonoRepoOrchestrator:
         Returns:
             List of responses in order
 
+        Raises:
+            OrchestratorError: If orchestrator not running
+        """
+        return list(self.sequential_discussion_iter(question, cli_order))
+
+    def sequential_discussion_iter(
+        self, question: str, cli_order: Optional[List[str]] = None
+    ) -> Iterator[DiscussionResponse]:
+        """
+        Run sequential discussion mode, yielding each response as it arrives.
+
+        Each response is yielded before the next CLI is queried. History
+        is saved once the iterator is exhausted.
+
+        Args:
+            question: Question to ask
+            cli_order: Optional custom CLI order (defaults to Claude → Codex → Gemini)
+
+        Returns:
+            Iterator of responses in order
+
         Raises:
             OrchestratorError: If orchestrator not running
         """
         if self.state != OrchestratorState.RUNNING:
             raise OrchestratorError("Orchestrator not running")
 
-        # Default order: Claude → Codex → Gemini
-        if cli_order is None:
-            cli_order = ["claude_code", "codex", "gemini"]
+        managers = self.ai_managers
+        cli_order = self.sequential_order(cli_order, managers)
+
+        return self._iter_sequential(question, cli_order, managers)
+
+    def sequential_order(
+        self,
+        cli_order: Optional[List[str]] = None,
+        managers: Optional[Mapping[str, AICliManager]] = None,
+    ) -> List[str]:
+        """
+        Get the CLIs a sequential discussion yields a response for, in order.
+
+        Includes managed CLIs that are not alive; they yield an error entry.
 
-        # Filter to only active CLIs
-        cli_order = [cli for cli in cli_order if cli in self.ai_managers]
+        Args:
+            cli_order: Optional custom CLI order (defaults to SEQUENTIAL_ORDER)
+            managers: Manager snapshot to filter against (defaults to current)
 
+        Returns:
+            List of CLI names
+        """
+        if cli_order is None:
+            cli_order = self.SEQUENTIAL_ORDER
+        if managers is None:
+            managers = self.ai_managers
+        return [cli for cli in cli_order if cli in managers]
+
+    def _iter_sequential(
+        self, question: str, cli_order: List[str], managers: Mapping[str, AICliManager]
+    ) -> Iterator[DiscussionResponse]:
+        """Generator behind sequential_discussion_iter."""
         logger.debug(f"Starting sequential discussion with order: {cli_order}")
         responses = []
-        context = question
+        # The prompt is the question followed by each earlier response; keep
+        # the pieces and join them once per send instead of growing a string
+        context_parts = [question]
 
         for cli_name in cli_order:
-            manager = self.ai_managers.get(cli_name)
+            manager = managers.get(cli_name)
             if not manager or not manager.is_alive():
                 logger.warning(f"Skipping {cli_name} (not available)")
-                responses.append(
-                    DiscussionResponse(
-                        cli_name=cli_name,
-                        response="",
-                        timestamp=datetime.now(),
-                        error=f"{cli_name} not available",
-                    )
+                discussion_response = DiscussionResponse(
+                    cli_name=cli_name,
+                    response="",
+                    timestamp=datetime.now(),
+                    error=f"{cli_name} not available",
                 )
+                responses.append(discussion_response)
+                yield discussion_response
                 continue
 
             try:
                 logger.debug(f"Sending to {cli_name}...")
+                context = "\n\n".join(context_parts)
                 response = manager.send_command(context)  # Uses configured timeout
 
                 discussion_response = DiscussionResponse(
                     cli_name=cli_name, response=response, timestamp=datetime.now()
                 )
-                responses.append(discussion_response)
 
                 # Add response to context for next CLI
-                context = f"{context}\n\n{cli_name} response:\n{response}"
+                context_parts.append(f"{cli_name} response:\n{response}")
 
                 logger.debug(f"✓ Received response from {cli_name}")
 
             except (AICliTimeoutError, AICliProcessError) as e:
                 logger.error(f"Error from {cli_name}: {e}")
-                responses.append(
-                    DiscussionResponse(
-                        cli_name=cli_name,
-                        response="",
-                        timestamp=datetime.now(),
-                        error=str(e),
-                    )
+                discussion_response = DiscussionResponse(
+                    cli_name=cli_name,
+                    response="",
+                    timestamp=datetime.now(),
+                    error=str(e),
                 )
 
+            responses.append(discussion_response)
+            yield discussion_response
+
         # Save to conversation history
         self._add_to_history("sequential", question, responses)
 
-        return responses
-
     def parallel_discussion(
         self, question: str, timeout: int = 300
     ) -> List[DiscussionResponse]:
@@ -342,13 +560,39 @@ class MonoRepoOrchestrator:
         Returns:
             List of responses (order may vary)
 
+        Raises:
+            OrchestratorError: If orchestrator not running
+        """
+        return list(self.parallel_discussion_iter(question, timeout=timeout))
+
+    def parallel_discussion_iter(
+        self, question: str, timeout: int = 300
+    ) -> Iterator[DiscussionResponse]:
+        """
+        Run parallel discussion mode, yielding responses in completion order.
+
+        All AIs receive the question simultaneously. History is saved once
+        the iterator is exhausted.
+
+        Args:
+            question: Question to ask all AIs
+            timeout: Timeout per CLI in seconds
+
+        Returns:
+            Iterator of responses as each CLI finishes
+
         Raises:
             OrchestratorError: If orchestrator not running
         """
         if self.state != OrchestratorState.RUNNING:
             raise OrchestratorError("Orchestrator not running")
 
-        logger.debug(f"Starting parallel discussion with {len(self.ai_managers)} CLIs")
+        return self._iter_parallel(question, timeout)
+
+    def _iter_parallel(self, question: str, timeout: int) -> Iterator[DiscussionResponse]:
+        """Generator behind parallel_discussion_iter."""
+        managers = self.ai_managers
+        logger.debug(f"Starting parallel discussion with {len(managers)} CLIs")
         responses = []
 
         def query_cli(cli_name: str, manager: AICliManager) -> DiscussionResponse:
@@ -379,36 +623,32 @@ class MonoRepoOrchestrator:
                     error=str(e),
                 )
 
-        # Use ThreadPoolExecutor for parallel execution
-        with ThreadPoolExecutor(max_workers=len(self.ai_managers)) as executor:
-            # Submit all queries
-            future_to_cli = {
-                executor.submit(query_cli, cli_name, manager): cli_name
-                for cli_name, manager in self.ai_managers.items()
-            }
+        # Submit all queries to the shared pool
+        executor = self._get_executor()
+        future_to_cli = {
+            executor.submit(query_cli, cli_name, manager): cli_name
+            for cli_name, manager in managers.items()
+        }
 
-            # Collect results as they complete
-            for future in as_completed(future_to_cli):
-                cli_name = future_to_cli[future]
-                try:
-                    response = future.result()
-                    responses.append(response)
-                except Exception as e:
-                    logger.error(f"Exception from {cli_name}: {e}")
-                    responses.append(
-                        DiscussionResponse(
-                            cli_name=cli_name,
-                            response="",
-                            timestamp=datetime.now(),
-                            error=f"Exception: {e}",
-                        )
-                    )
+        # Collect results as they complete
+        for future in as_completed(future_to_cli):
+            cli_name = future_to_cli[future]
+            try:
+                response = future.result()
+            except Exception as e:
+                logger.error(f"Exception from {cli_name}: {e}")
+                response = DiscussionResponse(
+                    cli_name=cli_name,
+                    response="",
+                    timestamp=datetime.now(),
+                    error=f"Exception: {e}",
+                )
+            responses.append(response)
+            yield response
 
         # Save to conversation history
         self._add_to_history("parallel", question, responses)
 
-        return responses
-
     def review_mode(
         self,
         task: str,
@@ -436,10 +676,11 @@ class MonoRepoOrchestrator:
         if self.state != OrchestratorState.RUNNING:
             raise OrchestratorError("Orchestrator not running")
 
-        if proposer not in self.ai_managers:
+        managers = self.ai_managers
+        if proposer not in managers:
             raise OrchestratorError(f"Proposer CLI '{proposer}' not available")
 
-        if reviewer not in self.ai_managers:
+        if reviewer not in managers:
             raise OrchestratorError(f"Reviewer CLI '{reviewer}' not available")
 
         logger.debug(f"Starting review mode: {proposer} → {reviewer} ({iterations} iterations)")
@@ -454,7 +695,7 @@ class MonoRepoOrchestrator:
 
             # Get proposal
             try:
-                proposer_mgr = self.ai_managers[proposer]
+                proposer_mgr = managers[proposer]
                 logger.debug(f"Getting proposal from {proposer}...")
                 proposal_response = proposer_mgr.send_command(current_task, timeout=300)
 
@@ -482,7 +723,7 @@ class MonoRepoOrchestrator:
 
             # Get review
             try:
-                reviewer_mgr = self.ai_managers[reviewer]
+                reviewer_mgr = managers[reviewer]
                 review_prompt = f"Review this proposal:\n\n{proposal_response}"
                 logger.debug(f"Getting review from {reviewer}...")
                 review_response = reviewer_mgr.send_command(review_prompt, timeout=300)
@@ -524,66 +765,108 @@ class MonoRepoOrchestrator:
         """
         Stop all AI CLI processes gracefully.
 
+        Safe to call more than once; only the first call does any work.
+        Calls from other threads wait until it has finished; a call from
+        the thread already stopping (e.g. a signal handler) returns at once.
+
         Args:
             force: If True, force kill processes
         """
         with self._lock:
-            if self.state == OrchestratorState.STOPPED:
-                logger.debug("Orchestrator already stopped")
-                return
+            first = not self._stopped.is_set()
+            if first:
+                self._stopped.set()
+                self._stop_done.clear()
+                self._stopping_thread = threading.get_ident()
+
+        if not first:
+            if self._stopping_thread != threading.get_ident():
+                self._stop_done.wait()
+            logger.debug("Orchestrator already stopping")
+            return
 
-            logger.debug(f"Closing {len(self.ai_managers)} CLI sessions...")
+        try:
+            self._stop_all_clis(force)
+        finally:
+            self._stop_done.set()
 
-            # Close each CLI session
-            for cli_name, manager in list(self.ai_managers.items()):
-                try:
-                    manager.stop(force=force)
-                except Exception as e:
-                    logger.error(f"Error closing {cli_name}: {e}")
+    def stop_in_progress(self) -> bool:
+        """Whether a stop_all_clis call has begun but not yet finished."""
+        return self._stopped.is_set() and not self._stop_done.is_set()
 
-            # Clear managers
-            self.ai_managers.clear()
+    def _stop_all_clis(self, force: bool) -> None:
+        """Body of stop_all_clis, run by the first caller only."""
+        # Detach the managers under the lock; stopping them can take seconds
+        with self._lock:
+            if self.state == OrchestratorState.STOPPED:
+                logger.debug("Orchestrator already stopped")
+                return
 
-            # Update state
+            managers = self.ai_managers
+            self.ai_managers = MappingProxyType({})
             self.state = OrchestratorState.STOPPED
             self.session_state.active_clis = []
             self.session_state.state = self.state
-            self._save_session_state()
 
-            logger.debug("Session ended")
+        logger.debug(f"Closing {len(managers)} CLI sessions...")
+
+        # Close each CLI session
+        for cli_name, manager in managers.items():
+            try:
+                manager.stop(force=force)
+            except Exception as e:
+                logger.error(f"Error closing {cli_name}: {e}")
+
+        # stop() killed any query subprocess still running (print-mode
+        # managers) or the CLI itself (pexpect managers), so in-flight
+        # queries return promptly and waiting for the workers is bounded
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        self._save_session_state()
+        self._flush_session_state()
+
+        logger.debug("Session ended")
 
     def pause(self) -> None:
         """Pause the orchestrator without stopping CLIs."""
-        with self._lock:
-            if self.state == OrchestratorState.RUNNING:
-                self.state = OrchestratorState.PAUSED
-                self.session_state.state = self.state
-                self._save_session_state()
-                logger.info("Orchestrator paused")
+        if self._try_transition((OrchestratorState.RUNNING,), OrchestratorState.PAUSED):
+            self.session_state.state = OrchestratorState.PAUSED
+            self._save_session_state()
+            logger.info("Orchestrator paused")
 
     def resume(self) -> None:
         """Resume a paused orchestrator."""
-        with self._lock:
-            if self.state == OrchestratorState.PAUSED:
-                # Check all CLIs are still alive
-                dead_clis = [
-                    name for name, mgr in self.ai_managers.items() if not mgr.is_alive()
-                ]
-
-                if dead_clis:
-                    logger.warning(f"Some CLIs died during pause: {dead_clis}")
-                    # Attempt to restart dead CLIs
-                    for cli_name in dead_clis:
-                        try:
-                            logger.info(f"Restarting {cli_name}...")
-                            self.ai_managers[cli_name].restart()
-                        except Exception as e:
-                            logger.error(f"Failed to restart {cli_name}: {e}")
-
-                self.state = OrchestratorState.RUNNING
-                self.session_state.state = self.state
-                self._save_session_state()
-                logger.info("Orchestrator resumed")
+        # STARTING keeps other start/resume calls out while CLIs restart
+        if not self._try_transition((OrchestratorState.PAUSED,), OrchestratorState.STARTING):
+            return
+
+        # Check all CLIs are still alive
+        managers = self.ai_managers
+        dead_clis = [name for name, mgr in managers.items() if not mgr.is_alive()]
+
+        if dead_clis:
+            logger.warning(f"Some CLIs died during pause: {dead_clis}")
+            # Attempt to restart dead CLIs; each restart re-probes its CLI,
+            # so run them side by side on the worker pool
+            executor = self._get_executor()
+            futures = {}
+            for cli_name in dead_clis:
+                logger.info(f"Restarting {cli_name}...")
+                futures[cli_name] = executor.submit(managers[cli_name].restart)
+
+            for cli_name, future in futures.items():
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.error(f"Failed to restart {cli_name}: {e}")
+
+        if self._try_transition((OrchestratorState.STARTING,), OrchestratorState.RUNNING):
+            self.session_state.state = OrchestratorState.RUNNING
+            self._save_session_state()
+            logger.info("Orchestrator resumed")
 
     def _add_to_history(
         self,
@@ -597,53 +880,101 @@ class MonoRepoOrchestrator:
             "timestamp": datetime.now().isoformat(),
             "mode": mode,
             "question": question,
-            "responses": [
-                {
-                    "cli_name": r.cli_name,
-                    "response": r.response,
-                    "timestamp": r.timestamp.isoformat(),
-                    "error": r.error,
-                    "metadata": r.metadata,
-                }
-                for r in responses
-            ],
+            "responses": [r.to_dict() for r in responses],
             "metadata": metadata or {},
         }
 
         self.session_state.conversation_history.append(entry)
 
-        # Save state after each discussion
-        self._save_session_state()
+        # Persist just this discussion; the header in state.json is unchanged
+        self._append_history(entry)
 
-    def _save_session_state(self) -> None:
-        """Save session state to disk."""
+    def _append_history(self, entry: Dict[str, Any]) -> None:
+        """Append one discussion to the session's history.jsonl."""
         try:
-            state_file = self.session_dir / "state.json"
-
-            state_data = {
-                "session_id": self.session_state.session_id,
-                "project_path": self.session_state.project_path,
-                "started_at": self.session_state.started_at.isoformat(),
-                "active_clis": self.session_state.active_clis,
-                "conversation_history": self.session_state.conversation_history,
-                "state": self.session_state.state.value,
-                "metadata": self.session_state.metadata,
-            }
+            line = _dump_json(entry) + b"\n"
+            with open(self._history_file, "ab") as f:
+                f.write(line)
 
-            with open(state_file, "w") as f:
-                json.dump(state_data, f, indent=2)
+        except Exception as e:
+            logger.error(f"Failed to save conversation history: {e}")
 
-            logger.debug(f"Session state saved to {state_file}")
+    def _save_session_state(self) -> None:
+        """
+        Queue the session header (everything but the history) to be saved.
 
-        except Exception as e:
-            logger.error(f"Failed to save session state: {e}")
+        Returns without waiting for the disk; if the writer falls behind,
+        the oldest queued snapshot is dropped, since a newer one follows.
+        """
+        snapshot = {
+            "session_id": self.session_state.session_id,
+            "project_path": self.session_state.project_path,
+            "started_at": self.session_state.started_at.isoformat(),
+            "active_clis": list(self.session_state.active_clis),
+            "state": self.session_state.state.value,
+            "metadata": dict(self.session_state.metadata),
+        }
 
-    def load_session_state(self, session_id: str) -> bool:
+        with self._save_thread_lock:
+            if self._save_thread is None:
+                self._save_thread = threading.Thread(
+                    target=self._save_worker, name="session-state-writer", daemon=True
+                )
+                self._save_thread.start()
+
+            while True:
+                try:
+                    self._save_queue.put_nowait(snapshot)
+                    break
+                except queue.Full:
+                    try:
+                        self._save_queue.get_nowait()
+                    except queue.Empty:
+                        pass
+
+    def _flush_session_state(self) -> None:
+        """Wait for queued saves to reach disk and stop the writer thread."""
+        with self._save_thread_lock:
+            thread, self._save_thread = self._save_thread, None
+            if thread is None:
+                return
+            self._save_queue.put(None)
+
+        thread.join()
+
+    def _save_worker(self) -> None:
+        """Write queued state snapshots to state.json until a None arrives."""
+        state_file = self.session_dir / "state.json"
+        tmp_file = self.session_dir / "state.json.tmp"
+
+        while True:
+            state_data = self._save_queue.get()
+            if state_data is None:
+                return
+
+            try:
+                # Write and fsync a temp file, then rename it over state.json
+                # so a crash never leaves a torn file behind
+                with open(tmp_file, "wb") as f:
+                    f.write(_dump_json(state_data))
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_file, state_file)
+
+                logger.debug(f"Session state saved to {state_file}")
+
+            except Exception as e:
+                logger.error(f"Failed to save session state: {e}")
+
+    def load_session_state(self, session_id: str, load_history: bool = True) -> bool:
         """
         Load session state from disk.
 
         Args:
             session_id: Session ID to load
+            load_history: Also read the conversation history into memory.
+                Pass False when only the header is needed; the history can
+                then be streamed with iter_history.
 
         Returns:
             True if loaded successfully
@@ -656,8 +987,16 @@ class MonoRepoOrchestrator:
                 logger.error(f"Session state file not found: {state_file}")
                 return False
 
-            with open(state_file, "r") as f:
-                state_data = json.load(f)
+            state_data = _load_json(state_file.read_bytes())
+
+            # Sessions saved before history.jsonl kept the history in state.json
+            conversation_history = state_data.get("conversation_history")
+            if conversation_history is None:
+                conversation_history = (
+                    list(self._iter_history_file(session_dir / "history.jsonl"))
+                    if load_history
+                    else []
+                )
 
             # Restore state
             self.session_id = state_data["session_id"]
@@ -666,7 +1005,7 @@ class MonoRepoOrchestrator:
                 project_path=state_data["project_path"],
                 started_at=datetime.fromisoformat(state_data["started_at"]),
                 active_clis=state_data["active_clis"],
-                conversation_history=state_data["conversation_history"],
+                conversation_history=conversation_history,
                 state=OrchestratorState(state_data["state"]),
                 metadata=state_data.get("metadata", {}),
             )
@@ -678,6 +1017,32 @@ class MonoRepoOrchestrator:
             logger.error(f"Failed to load session state: {e}")
             return False
 
+    def iter_history(self, session_id: str) -> Iterator[Dict[str, Any]]:
+        """
+        Stream a saved session's conversation history, one entry at a time.
+
+        Args:
+            session_id: Session ID to read
+
+        Returns:
+            Iterator of discussion entries in order (empty if none were saved)
+        """
+        session_dir = Path.home() / ".ai-roundtable" / "sessions" / session_id
+        return self._iter_history_file(session_dir / "history.jsonl")
+
+    def _iter_history_file(self, history_file: Path) -> Iterator[Dict[str, Any]]:
+        """Yield the entries of a history.jsonl file, skipping torn lines."""
+        try:
+            with open(history_file, "rb") as f:
+                for line in f:
+                    try:
+                        yield _load_json(line)
+                    except ValueError:
+                        # A line torn by a crash mid-append
+                        logger.warning(f"Skipping unreadable history line in {history_file}")
+        except FileNotFoundError:
+            return
+
     def get_active_clis(self) -> List[str]:
         """Get list of active CLI names."""
         return [name for name, mgr in self.ai_managers.items() if mgr.is_alive()]
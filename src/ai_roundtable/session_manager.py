@@ -2,19 +2,48 @@
 
 import json
 import os
+import select
 import time
-from dataclasses import asdict, dataclass, field
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 import psutil
 
 from .logging_config import get_logger
 
+try:
+    import orjson
+except ImportError:  # optional, see the "fast-json" extra
+    orjson = None
+
 logger = get_logger(__name__)
 
 
+def _dump_json(data: Any) -> bytes:
+    """Serialize session data as indented JSON, using orjson when installed."""
+    if orjson is not None:
+        # OPT_NON_STR_KEYS matches json.dumps, which stringifies int/float keys
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+def _dump_json_line(data: Any) -> bytes:
+    """Serialize one history entry as a compact, newline-terminated JSON line."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+    return json.dumps(data).encode("utf-8") + b"\n"
+
+
+def _load_json(raw: bytes) -> Any:
+    """Parse session data written by _dump_json."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 @dataclass
 class SessionInfo:
     """Session information data class."""
@@ -27,6 +56,42 @@ class SessionInfo:
     cli_pids: Dict[str, int] = field(default_factory=dict)
     state: str = "stopped"
     metadata: Dict[str, Any] = field(default_factory=dict)
+    # last_active as a Unix timestamp; 0.0 in files written before it was stored
+    last_active_ts: float = 0.0
+    # False if loaded with load_history=False, leaving conversation_history empty
+    history_loaded: bool = field(default=True, repr=False, compare=False)
+
+    def copy(self, include_history: bool = True) -> "SessionInfo":
+        """Copy with its own history list, PID and metadata dicts."""
+        return replace(
+            self,
+            conversation_history=list(self.conversation_history) if include_history else [],
+            cli_pids=dict(self.cli_pids),
+            metadata=dict(self.metadata),
+            history_loaded=self.history_loaded and include_history,
+        )
+
+    def to_dict(self, include_history: bool = True) -> Dict[str, Any]:
+        """
+        Convert to a plain dict (shallow, unlike asdict).
+
+        Args:
+            include_history: If False, leave out conversation_history, as in
+                the session file, which keeps the history in its own file
+        """
+        data = {
+            "session_id": self.session_id,
+            "project_path": self.project_path,
+            "created_at": self.created_at,
+            "last_active": self.last_active,
+            "last_active_ts": self.last_active_ts,
+            "cli_pids": dict(self.cli_pids),
+            "state": self.state,
+            "metadata": dict(self.metadata),
+        }
+        if include_history:
+            data["conversation_history"] = list(self.conversation_history)
+        return data
 
 
 class SessionManagerError(Exception):
@@ -48,6 +113,9 @@ class SessionManager:
     - Conversation history management
     """
 
+    # Most parsed sessions kept in memory; the least recently used go first
+    CACHE_SIZE = 128
+
     def __init__(self, session_dir: Optional[Path] = None):
         """
         Initialize SessionManager.
@@ -61,6 +129,14 @@ class SessionManager:
         self.session_dir = Path(session_dir)
         self.session_dir.mkdir(parents=True, exist_ok=True)
 
+        # Parsed sessions keyed by ID, with the (mtime_ns, size) of the session
+        # and history files they were read from; a changed file is parsed again
+        self._cache: "OrderedDict[str, Tuple[Tuple, SessionInfo]]" = OrderedDict()
+
+        # psutil.Process objects by PID, so a PID probed twice is only looked
+        # up once; is_running() on a kept object still detects PID reuse
+        self._processes: Dict[int, psutil.Process] = {}
+
         logger.debug(f"SessionManager initialized with dir: {self.session_dir}")
 
     def create_session(
@@ -85,16 +161,17 @@ class SessionManager:
                 session_id = self._generate_session_id(project_path)
 
             # Create session info
+            now = datetime.now().isoformat()
             session_info = SessionInfo(
                 session_id=session_id,
                 project_path=str(project_path.absolute()),
-                created_at=datetime.now().isoformat(),
-                last_active=datetime.now().isoformat(),
+                created_at=now,
+                last_active=now,
                 state="running",
             )
 
             # Save to disk
-            self._save_session(session_info)
+            self._save_session(session_info, now=now)
 
             logger.info(f"Created session {session_id} for {project_path}")
             return session_info
@@ -118,55 +195,162 @@ class SessionManager:
         project_name = project_path.name
         return f"session_{project_name}_{timestamp}"
 
-    def load_session(self, session_id: str) -> Optional[SessionInfo]:
+    def _history_file(self, session_id: str) -> Path:
+        """Path of the append-only conversation history for a session."""
+        return self.session_dir / f"{session_id}.history.jsonl"
+
+    def _file_key(self, session_file: Path, history_file: Path) -> Tuple:
+        """
+        Cache validation key for a session: (mtime_ns, size) of both files.
+
+        Raises:
+            FileNotFoundError: If the session file does not exist
+        """
+        stat = session_file.stat()
+        try:
+            history_stat = history_file.stat()
+            history_key = (history_stat.st_mtime_ns, history_stat.st_size)
+        except FileNotFoundError:
+            history_key = None
+        return (stat.st_mtime_ns, stat.st_size, history_key)
+
+    def load_session(self, session_id: str, load_history: bool = True) -> Optional[SessionInfo]:
         """
         Load session from disk.
 
+        The conversation history is read from the session's history.jsonl
+        file. Session files written before the history moved there still
+        embed it, and it is used as-is until the session is next saved.
+
         Args:
             session_id: Session ID to load
+            load_history: If False, only read the session file and leave
+                conversation_history empty
 
         Returns:
             SessionInfo if found, None otherwise
         """
         session_file = self.session_dir / f"{session_id}.json"
+        history_file = self._history_file(session_id)
 
-        if not session_file.exists():
+        try:
+            file_key = self._file_key(session_file, history_file)
+        except FileNotFoundError:
             logger.warning(f"Session file not found: {session_file}")
+            self._cache.pop(session_id, None)
             return None
 
+        cached = self._cache.get(session_id)
+        if cached is not None and cached[0] == file_key:
+            self._cache.move_to_end(session_id)
+            return cached[1].copy(include_history=load_history)
+
         try:
-            with open(session_file, "r") as f:
-                data = json.load(f)
+            data = _load_json(session_file.read_bytes())
+
+            # Without a history file the session is complete as read
+            complete = load_history or file_key[2] is None
+            if file_key[2] is not None:
+                if load_history:
+                    data["conversation_history"] = list(self._iter_history_file(history_file))
+                else:
+                    data.pop("conversation_history", None)
 
             session_info = SessionInfo(**data)
             logger.debug(f"Loaded session {session_id}")
-            return session_info
+            if not complete:
+                session_info.history_loaded = False
+                return session_info
+
+            self._cache_put(session_id, file_key, session_info)
+            return session_info.copy(include_history=load_history)
 
         except Exception as e:
             logger.error(f"Failed to load session {session_id}: {e}")
             return None
 
-    def _save_session(self, session_info: SessionInfo) -> None:
+    def _cache_put(self, session_id: str, file_key: Tuple, session_info: SessionInfo) -> None:
+        """Cache a parsed session, evicting the least recently used past CACHE_SIZE."""
+        self._cache[session_id] = (file_key, session_info)
+        self._cache.move_to_end(session_id)
+        if len(self._cache) > self.CACHE_SIZE:
+            self._cache.popitem(last=False)
+
+    def _iter_history_file(self, history_file: Path) -> Iterator[Dict[str, Any]]:
+        """Yield the entries of a history.jsonl file, skipping torn lines."""
+        with open(history_file, "rb") as f:
+            for line in f:
+                try:
+                    yield _load_json(line)
+                except ValueError:
+                    # A line torn by a crash mid-append
+                    logger.warning(f"Skipping unreadable history line in {history_file}")
+
+    def _append_history(
+        self, session_info: SessionInfo, entries: List[Dict[str, Any]]
+    ) -> None:
+        """
+        Append entries to a session's history.jsonl.
+
+        If the file does not exist yet, it is created from the session's
+        whole history instead, which also carries over history embedded in
+        session files from before it had its own file. For a session loaded
+        with load_history=False, that history is read back from the session
+        file, since the in-memory copy lacks it.
+
+        Args:
+            session_info: Session the entries belong to
+            entries: New entries, already appended to its conversation_history
+        """
+        history_file = self._history_file(session_info.session_id)
+        if not history_file.exists():
+            if session_info.history_loaded:
+                entries = session_info.conversation_history
+            else:
+                stored = self.load_session(session_info.session_id)
+                entries = (stored.conversation_history if stored else []) + list(entries)
+        if not entries:
+            return
+
+        with open(history_file, "ab") as f:
+            f.write(b"".join(_dump_json_line(entry) for entry in entries))
+
+    def _save_session(self, session_info: SessionInfo, now: Optional[str] = None) -> None:
         """
         Save session to disk.
 
         Args:
             session_info: SessionInfo to save
+            now: ISO timestamp for last_active, if the caller already has one
 
         Raises:
             SessionManagerError: If save fails
         """
         session_file = self.session_dir / f"{session_info.session_id}.json"
+        history_file = self._history_file(session_info.session_id)
 
         try:
             # Update last active timestamp
-            session_info.last_active = datetime.now().isoformat()
+            session_info.last_active = now or datetime.now().isoformat()
+            session_info.last_active_ts = time.time()
+
+            # Move any history still embedded in the session file out first
+            self._append_history(session_info, [])
 
-            # Convert to dict and save
-            data = asdict(session_info)
+            # Convert to dict and save; the history lives in its own file
+            data = session_info.to_dict(include_history=False)
 
-            with open(session_file, "w") as f:
-                json.dump(data, f, indent=2)
+            session_file.write_bytes(_dump_json(data))
+
+            if session_info.history_loaded:
+                self._cache_put(
+                    session_info.session_id,
+                    self._file_key(session_file, history_file),
+                    session_info.copy(),
+                )
+            else:
+                # Missing the history, so not a complete copy to cache
+                self._cache.pop(session_info.session_id, None)
 
             logger.debug(f"Saved session {session_info.session_id}")
 
@@ -179,6 +363,7 @@ class SessionManager:
         cli_pids: Optional[Dict[str, int]] = None,
         state: Optional[str] = None,
         metadata: Optional[Dict[str, Any]] = None,
+        session_info: Optional[SessionInfo] = None,
     ) -> bool:
         """
         Update session with new information.
@@ -188,11 +373,14 @@ class SessionManager:
             cli_pids: Optional CLI PIDs to update
             state: Optional state to update
             metadata: Optional metadata to merge
+            session_info: Optional already loaded session to update in place
+                instead of reading it again
 
         Returns:
             True if updated successfully
         """
-        session_info = self.load_session(session_id)
+        if session_info is None:
+            session_info = self.load_session(session_id)
         if not session_info:
             logger.warning(f"Session {session_id} not found for update")
             return False
@@ -216,45 +404,63 @@ class SessionManager:
             return False
 
     def save_conversation(
-        self, session_id: str, conversation_entry: Dict[str, Any]
+        self,
+        session_id: str,
+        conversation_entry: Dict[str, Any],
+        session_info: Optional[SessionInfo] = None,
     ) -> bool:
         """
         Save a conversation entry to session history.
 
+        The entry is appended to the session's history.jsonl, so the cost
+        does not grow with the length of the history.
+
         Args:
             session_id: Session ID
             conversation_entry: Conversation entry to save
+            session_info: Optional already loaded session to append to in
+                place instead of reading it again
 
         Returns:
             True if saved successfully
         """
-        session_info = self.load_session(session_id)
+        if session_info is None:
+            session_info = self.load_session(session_id)
         if not session_info:
             logger.warning(f"Session {session_id} not found for conversation save")
             return False
 
         # Add timestamp if not present
+        now = datetime.now().isoformat()
         if "timestamp" not in conversation_entry:
-            conversation_entry["timestamp"] = datetime.now().isoformat()
+            conversation_entry["timestamp"] = now
 
         # Append to history
         session_info.conversation_history.append(conversation_entry)
 
         # Save
         try:
-            self._save_session(session_info)
+            try:
+                self._append_history(session_info, [conversation_entry])
+            except OSError as e:
+                raise SessionManagerError(f"Failed to append history: {e}")
+            self._save_session(session_info, now=now)
             logger.debug(f"Saved conversation to session {session_id}")
             return True
         except SessionManagerError as e:
             logger.error(f"Failed to save conversation: {e}")
             return False
 
-    def list_sessions(self, active_only: bool = False) -> List[SessionInfo]:
+    def list_sessions(
+        self, active_only: bool = False, load_history: bool = True
+    ) -> List[SessionInfo]:
         """
         List all sessions.
 
         Args:
             active_only: If True, only return sessions with running processes
+            load_history: If False, only read the session files and leave
+                conversation_history empty
 
         Returns:
             List of SessionInfo objects
@@ -262,31 +468,69 @@ class SessionManager:
         sessions = []
 
         # Find all session files
-        for session_file in self.session_dir.glob("*.json"):
-            session_id = session_file.stem
+        for entry in self._scan_session_files():
+            session_id = entry.name[: -len(".json")]
 
-            session_info = self.load_session(session_id)
+            session_info = self.load_session(session_id, load_history=load_history)
             if not session_info:
                 continue
 
-            # Check if active if requested
-            if active_only:
-                if not self._is_session_active(session_info):
-                    continue
-
             sessions.append(session_info)
 
+        # Check if active if requested
+        if active_only:
+            live_pids = self.get_live_pids(sessions)
+            sessions = [s for s in sessions if self._is_session_active(s, live_pids)]
+
         # Sort by last active (most recent first)
         sessions.sort(key=lambda s: s.last_active, reverse=True)
 
         return sessions
 
-    def _is_session_active(self, session_info: SessionInfo) -> bool:
+    def _scan_session_files(self) -> Iterator[os.DirEntry]:
+        """
+        Yield the directory entries of the session files.
+
+        Uses os.scandir rather than Path.glob, which builds a Path and runs
+        fnmatch for every entry; the file type comes from the directory read.
+
+        Returns:
+            Iterator of os.DirEntry objects for *.json files
+        """
+        with os.scandir(self.session_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(".json") and entry.is_file():
+                    yield entry
+
+    def get_live_pids(self, sessions: Iterable[SessionInfo]) -> Set[int]:
+        """
+        Check the CLI PIDs of many sessions in a single pass.
+
+        The process table is read once (a single /proc listing on Linux)
+        and the recorded PIDs are matched against it, so callers iterating
+        over several sessions can pass the result to _is_session_active and
+        get_session_summary instead of probing per session.
+
+        Args:
+            sessions: Sessions whose PIDs should be checked
+
+        Returns:
+            Set of PIDs that are still running
+        """
+        pids = {pid for session_info in sessions for pid in session_info.cli_pids.values()}
+        if not pids:
+            return set()
+        return pids.intersection(psutil.pids())
+
+    def _is_session_active(
+        self, session_info: SessionInfo, live_pids: Optional[Set[int]] = None
+    ) -> bool:
         """
         Check if session has active processes.
 
         Args:
             session_info: SessionInfo to check
+            live_pids: Optional result of get_live_pids to check against
 
         Returns:
             True if any CLI process is running
@@ -294,16 +538,11 @@ class SessionManager:
         if not session_info.cli_pids:
             return False
 
-        # Check if any PID is still running
-        for cli_name, pid in session_info.cli_pids.items():
-            try:
-                process = psutil.Process(pid)
-                if process.is_running():
-                    return True
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                continue
+        if live_pids is not None:
+            return any(pid in live_pids for pid in session_info.cli_pids.values())
 
-        return False
+        # Check if any PID is still running
+        return any(self._is_pid_running(pid) for pid in session_info.cli_pids.values())
 
     def get_session_by_project(self, project_path: Path) -> Optional[SessionInfo]:
         """
@@ -317,54 +556,93 @@ class SessionManager:
         """
         project_str = str(project_path.absolute())
 
-        # Search all sessions
-        for session_info in self.list_sessions():
-            if session_info.project_path == project_str:
+        # Each save rewrites the session file, so newest-modified first is
+        # most recently active first; stop at the first match
+        session_files = []
+        for entry in self._scan_session_files():
+            try:
+                session_files.append((entry.stat().st_mtime_ns, entry.name[: -len(".json")]))
+            except FileNotFoundError:
+                continue
+        session_files.sort(reverse=True)
+
+        for _, session_id in session_files:
+            session_info = self.load_session(session_id, load_history=False)
+            if session_info and session_info.project_path == project_str:
                 # Return most recent session for this project
-                return session_info
+                return self.load_session(session_info.session_id)
 
         return None
 
-    def cleanup_session(self, session_id: str, remove_file: bool = False) -> bool:
+    def list_crashed_sessions(self, load_history: bool = True) -> List[SessionInfo]:
+        """
+        List sessions that recorded CLI PIDs none of which are still running.
+
+        Args:
+            load_history: If False, leave conversation_history empty
+
+        Returns:
+            List of SessionInfo objects, most recently active first
+        """
+        sessions = self.list_sessions(load_history=load_history)
+        live_pids = self.get_live_pids(sessions)
+        return [
+            s for s in sessions if s.cli_pids and not self._is_session_active(s, live_pids)
+        ]
+
+    def cleanup_session(
+        self,
+        session_id: str,
+        remove_file: bool = False,
+        session_info: Optional[SessionInfo] = None,
+    ) -> bool:
         """
         Clean up session.
 
         Args:
             session_id: Session ID to clean up
             remove_file: If True, delete the session file
+            session_info: Optional already loaded session, to skip reading it
+                again; its history is not needed
 
         Returns:
             True if cleaned up successfully
         """
         try:
-            session_info = self.load_session(session_id)
+            if session_info is None:
+                session_info = self.load_session(session_id, load_history=False)
             if not session_info:
                 logger.warning(f"Session {session_id} not found for cleanup")
                 return False
 
             # Terminate any running processes
+            terminated = []
             for cli_name, pid in session_info.cli_pids.items():
                 try:
-                    process = psutil.Process(pid)
+                    process = self._get_process(pid)
                     if process.is_running():
                         logger.info(f"Terminating {cli_name} (PID {pid})")
                         process.terminate()
-                        # Wait for termination
-                        process.wait(timeout=5)
-                except (psutil.NoSuchProcess, psutil.TimeoutExpired):
+                        terminated.append(process)
+                except psutil.NoSuchProcess:
                     pass
                 except Exception as e:
                     logger.warning(f"Error terminating process {pid}: {e}")
 
-            # Update state
-            session_info.state = "stopped"
-            session_info.cli_pids = {}
-            self._save_session(session_info)
+            # Wait for termination
+            if terminated:
+                self._wait_for_exit(terminated, timeout=5)
 
-            # Remove file if requested
-            if remove_file:
+            # Remove file if requested, otherwise record the stopped state
+            if not remove_file:
+                session_info.state = "stopped"
+                session_info.cli_pids = {}
+                self._save_session(session_info)
+            else:
                 session_file = self.session_dir / f"{session_id}.json"
                 session_file.unlink(missing_ok=True)
+                self._history_file(session_id).unlink(missing_ok=True)
+                self._cache.pop(session_id, None)
                 logger.info(f"Removed session file for {session_id}")
 
             logger.info(f"Cleaned up session {session_id}")
@@ -374,10 +652,68 @@ class SessionManager:
             logger.error(f"Failed to cleanup session {session_id}: {e}")
             return False
 
+    def _wait_for_exit(self, processes: List[psutil.Process], timeout: float) -> None:
+        """
+        Wait for processes to exit, up to timeout seconds in total.
+
+        On Linux each process gets a pidfd and all of them are registered with
+        a single poll object, so the wait blocks in the kernel until an exit
+        happens instead of repeatedly probing PIDs. Falls back to
+        psutil.wait_procs where pidfd_open is unavailable.
+
+        Args:
+            processes: Processes to wait for
+            timeout: Maximum time to wait in seconds
+        """
+        pidfd_open = getattr(os, "pidfd_open", None)
+        if pidfd_open is None:
+            psutil.wait_procs(processes, timeout=timeout)
+            return
+
+        poller = select.poll()
+        pidfds: Dict[int, psutil.Process] = {}
+
+        try:
+            for process in processes:
+                try:
+                    fd = pidfd_open(process.pid)
+                except ProcessLookupError:
+                    # Already exited
+                    continue
+                except OSError:
+                    # Kernel without pidfd support (< 5.3)
+                    psutil.wait_procs(processes, timeout=timeout)
+                    return
+
+                pidfds[fd] = process
+                poller.register(fd, select.POLLIN)
+
+            deadline = time.monotonic() + timeout
+            while pidfds:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    logger.warning(
+                        f"Timed out waiting for PIDs {[p.pid for p in pidfds.values()]} to exit"
+                    )
+                    break
+
+                for fd, _ in poller.poll(remaining * 1000):
+                    poller.unregister(fd)
+                    os.close(fd)
+                    del pidfds[fd]
+
+        finally:
+            for fd in pidfds:
+                os.close(fd)
+
     def cleanup_stale_sessions(self, max_age_hours: int = 24) -> int:
         """
         Clean up stale sessions (no activity for max_age_hours).
 
+        Every save rewrites the session file just after setting last_active,
+        so a file modified within max_age_hours cannot be stale; only older
+        files are parsed.
+
         Args:
             max_age_hours: Maximum age in hours
 
@@ -387,22 +723,42 @@ class SessionManager:
         cleaned = 0
         current_time = time.time()
         max_age_seconds = max_age_hours * 3600
+        cutoff = current_time - max_age_seconds
+
+        candidates = []
+        for entry in self._scan_session_files():
+            try:
+                if entry.stat().st_mtime > cutoff:
+                    continue
+            except FileNotFoundError:
+                continue
 
-        for session_info in self.list_sessions():
+            session_info = self.load_session(entry.name[: -len(".json")], load_history=False)
+            if session_info:
+                candidates.append(session_info)
+
+        live_pids = self.get_live_pids(candidates)
+
+        for session_info in candidates:
             # Parse last active time
             try:
-                last_active = datetime.fromisoformat(session_info.last_active)
-                age_seconds = current_time - last_active.timestamp()
+                last_active_ts = (
+                    session_info.last_active_ts
+                    or datetime.fromisoformat(session_info.last_active).timestamp()
+                )
+                age_seconds = current_time - last_active_ts
 
                 # Check if stale
                 if age_seconds > max_age_seconds:
                     # Only clean up if not active
-                    if not self._is_session_active(session_info):
+                    if not self._is_session_active(session_info, live_pids):
                         logger.info(
                             f"Cleaning up stale session {session_info.session_id} "
                             f"(age: {age_seconds / 3600:.1f} hours)"
                         )
-                        self.cleanup_session(session_info.session_id, remove_file=True)
+                        self.cleanup_session(
+                            session_info.session_id, remove_file=True, session_info=session_info
+                        )
                         cleaned += 1
 
             except Exception as e:
@@ -413,12 +769,15 @@ class SessionManager:
 
         return cleaned
 
-    def get_session_summary(self, session_id: str) -> Optional[Dict[str, Any]]:
+    def get_session_summary(
+        self, session_id: str, live_pids: Optional[Set[int]] = None
+    ) -> Optional[Dict[str, Any]]:
         """
         Get summary of session.
 
         Args:
             session_id: Session ID
+            live_pids: Optional result of get_live_pids to check against
 
         Returns:
             Summary dict or None if not found
@@ -427,8 +786,58 @@ class SessionManager:
         if not session_info:
             return None
 
+        if live_pids is None:
+            live_pids = self.get_live_pids([session_info])
+
+        return self._summarize(session_info, live_pids)
+
+    def list_sessions_with_summaries(self, active_only: bool = False) -> List[Dict[str, Any]]:
+        """
+        List session summaries, reading each session file once.
+
+        Equivalent to calling get_session_summary for every entry of
+        list_sessions, without re-loading the files or re-probing PIDs.
+
+        Args:
+            active_only: If True, only return sessions with running processes
+
+        Returns:
+            List of summary dicts, most recently active first
+        """
+        return list(self.iter_session_summaries(active_only=active_only))
+
+    def iter_session_summaries(self, active_only: bool = False) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over session summaries, reading each session file once.
+
+        Args:
+            active_only: If True, only yield sessions with running processes
+
+        Returns:
+            Iterator of summary dicts, most recently active first
+        """
+        sessions = self.list_sessions(load_history=False)
+        live_pids = self.get_live_pids(sessions)
+
+        for session_info in sessions:
+            summary = self._summarize(session_info, live_pids)
+            if active_only and not summary["is_active"]:
+                continue
+            yield summary
+
+    def _summarize(self, session_info: SessionInfo, live_pids: Set[int]) -> Dict[str, Any]:
+        """
+        Build the summary dict for a loaded session.
+
+        Args:
+            session_info: Session information
+            live_pids: Result of get_live_pids covering this session
+
+        Returns:
+            Summary dict
+        """
         # Check active status
-        is_active = self._is_session_active(session_info)
+        is_active = self._is_session_active(session_info, live_pids)
 
         return {
             "session_id": session_info.session_id,
@@ -437,14 +846,24 @@ class SessionManager:
             "last_active": session_info.last_active,
             "state": session_info.state,
             "is_active": is_active,
-            "conversation_count": len(session_info.conversation_history),
+            "conversation_count": (
+                len(session_info.conversation_history)
+                if session_info.history_loaded
+                else self._count_history(session_info.session_id)
+            ),
             "active_clis": [
-                cli
-                for cli, pid in session_info.cli_pids.items()
-                if self._is_pid_running(pid)
+                cli for cli, pid in session_info.cli_pids.items() if pid in live_pids
             ],
         }
 
+    def _count_history(self, session_id: str) -> int:
+        """Count the entries in a session's history.jsonl without parsing them."""
+        try:
+            with open(self._history_file(session_id), "rb") as f:
+                return sum(chunk.count(b"\n") for chunk in iter(lambda: f.read(1 << 16), b""))
+        except FileNotFoundError:
+            return 0
+
     def _is_pid_running(self, pid: int) -> bool:
         """
         Check if PID is running.
@@ -456,10 +875,33 @@ class SessionManager:
             True if running
         """
         try:
-            process = psutil.Process(pid)
-            return process.is_running()
+            if self._get_process(pid).is_running():
+                return True
         except (psutil.NoSuchProcess, psutil.AccessDenied):
-            return False
+            pass
+
+        # Forget it, in case the PID is reused by a new process
+        self._processes.pop(pid, None)
+        return False
+
+    def _get_process(self, pid: int) -> psutil.Process:
+        """
+        Get the psutil.Process for a PID, reusing one created earlier.
+
+        Args:
+            pid: Process ID
+
+        Returns:
+            psutil.Process object
+
+        Raises:
+            psutil.NoSuchProcess: If no process with this PID exists
+        """
+        process = self._processes.get(pid)
+        if process is None:
+            process = psutil.Process(pid)
+            self._processes[pid] = process
+        return process
 
     def recover_session(self, session_id: str) -> Optional[SessionInfo]:
         """
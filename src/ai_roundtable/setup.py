@@ -2,6 +2,7 @@
 
 import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Tuple
 from rich.console import Console
@@ -70,13 +71,15 @@ class DependencyChecker:
         """
         Check all required CLI dependencies.
 
+        The version probes run concurrently, so a slow or hanging CLI does
+        not hold up the others.
+
         Returns:
             Dictionary mapping CLI names to (is_available, version_or_error) tuples
         """
-        results = {}
-        for cli_name in self.REQUIRED_CLIS:
-            results[cli_name] = self.check_cli_available(cli_name)
-        return results
+        cli_names = list(self.REQUIRED_CLIS)
+        with ThreadPoolExecutor(max_workers=len(cli_names)) as executor:
+            return dict(zip(cli_names, executor.map(self.check_cli_available, cli_names)))
 
     def display_dependency_status(self, check_only: bool = False) -> bool:
         """
@@ -0,0 +1,70 @@
+"""Tests for SessionManager persistence."""
+
+import json
+
+from ai_roundtable.session_manager import SessionManager
+
+LEGACY_HISTORY = [{"question": "first"}, {"question": "second"}]
+
+
+def _write_legacy_session(session_dir, session_id="s1"):
+    """Write a session file from before history moved to history.jsonl."""
+    data = {
+        "session_id": session_id,
+        "project_path": "/tmp/project",
+        "created_at": "2024-01-01T00:00:00",
+        "last_active": "2024-01-01T00:00:00",
+        "conversation_history": LEGACY_HISTORY,
+        "cli_pids": {},
+        "state": "running",
+        "metadata": {},
+    }
+    (session_dir / f"{session_id}.json").write_text(json.dumps(data))
+
+
+def _questions(session_info):
+    return [entry["question"] for entry in session_info.conversation_history]
+
+
+def test_cleanup_keeps_embedded_history(tmp_path):
+    _write_legacy_session(tmp_path)
+    manager = SessionManager(tmp_path)
+
+    assert manager.cleanup_session("s1")
+
+    reloaded = SessionManager(tmp_path).load_session("s1")
+    assert reloaded.state == "stopped"
+    assert _questions(reloaded) == ["first", "second"]
+    assert (tmp_path / "s1.history.jsonl").exists()
+
+
+def test_cleanup_of_header_only_listing_keeps_embedded_history(tmp_path):
+    _write_legacy_session(tmp_path)
+    manager = SessionManager(tmp_path)
+
+    (session_info,) = manager.list_sessions(load_history=False)
+    assert manager.cleanup_session(session_info.session_id, session_info=session_info)
+
+    assert _questions(SessionManager(tmp_path).load_session("s1")) == ["first", "second"]
+
+
+def test_save_conversation_on_header_only_session_keeps_embedded_history(tmp_path):
+    _write_legacy_session(tmp_path)
+    manager = SessionManager(tmp_path)
+
+    session_info = manager.load_session("s1", load_history=False)
+    assert manager.save_conversation("s1", {"question": "third"}, session_info=session_info)
+
+    for loader in (manager, SessionManager(tmp_path)):
+        assert _questions(loader.load_session("s1")) == ["first", "second", "third"]
+
+
+def test_save_conversation_appends_to_history_file(tmp_path):
+    manager = SessionManager(tmp_path)
+    session_info = manager.create_session(tmp_path / "project", session_id="s2")
+
+    for question in ("a", "b"):
+        assert manager.save_conversation(session_info.session_id, {"question": question})
+
+    assert "conversation_history" not in json.loads((tmp_path / "s2.json").read_text())
+    assert _questions(SessionManager(tmp_path).load_session("s2")) == ["a", "b"]